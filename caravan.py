@@ -1,14 +1,72 @@
 """
 Caravan module - Defines caravan entities in the game world
 """
+import bisect
+import collections
+import itertools
 import random
 import time
-from typing import Tuple, List
+from typing import Tuple, List, Optional
+
+
+# Strength bonus per caravan type (added on top of escort strength)
+_TYPE_BONUS = {
+    'salt': 1,
+    'gold': 3,
+    'spices': 5,
+    'imperial': 8  # Imperial convoys are much stronger
+}
+
+# Raid difficulty labels, split at these combat strength thresholds
+_DIFFICULTY_THRESHOLDS = (15, 30, 50)
+_DIFFICULTY_LABELS = ('easy', 'medium', 'hard', 'legendary')
+
+# Spawn weights for random caravan types, in CARAVAN_TYPES order
+# (salt, gold, spices, imperial, sandworm); stored cumulative so
+# random.choices doesn't rebuild the running sum on every spawn
+_TYPE_WEIGHTS = (0.4, 0.35, 0.2, 0.049, 0.001)
+_TYPE_WEIGHTS_CUM = tuple(itertools.accumulate(_TYPE_WEIGHTS))
+
+# Axial offsets of the 6 neighbouring hexes
+_HEX_DIRS = ((1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1))
+
+# Hexes travelled per waypoint
+_WAYPOINT_DISTANCES = (1, 2, 3)
+
+# Source of unique caravan ids
+_uid_counter = itertools.count(1)
+
+
+def _make_property_generator(config: dict):
+    """Build a property generator with one caravan type's config baked in"""
+    escorts_min, escorts_max = config['escorts_range']
+    loot_min, loot_max = config['loot_range']
+    size = config['size']
+    move_interval = config['move_interval']
+    loot_types = config['loot_types']
+    randint = random.randint
+
+    def generate(caravan: 'Caravan'):
+        caravan.escorts = randint(escorts_min, escorts_max)
+        caravan.loot_value = randint(loot_min, loot_max)
+        caravan.size = size
+        caravan.move_interval = move_interval
+        caravan.loot_types = loot_types
+
+    return generate
 
 
 class Caravan:
     """Represents a trade caravan in the desert"""
 
+    __slots__ = (
+        'uid', 'q', 'r', 'caravan_type',
+        'escorts', 'loot_value', 'size', 'move_interval', 'loot_types',
+        'last_move_time', 'target_q', 'target_r', 'is_scouted',
+        'is_boss', 'max_health', 'health_percent_factor', 'current_health', 'clan_damage',
+        '_cache_strength', '_cache_difficulty', '_cache_desc', '_cache_loot'
+    )
+
     CARAVAN_TYPES = ['salt', 'gold', 'spices', 'imperial', 'sandworm']
 
     # Type configurations
@@ -58,6 +116,24 @@ class Caravan:
         }
     }
 
+    # Property generator per type, specialized once from TYPE_CONFIGS
+    _PROPERTY_GENERATORS = {
+        caravan_type: _make_property_generator(config)
+        for caravan_type, config in TYPE_CONFIGS.items()
+    }
+
+    # Loot shares as whole percentages so loot is split with integer math only
+    _LOOT_PERCENTS = {
+        caravan_type: tuple((loot_type, round(share * 100)) for loot_type, share in config['loot_types'].items())
+        for caravan_type, config in TYPE_CONFIGS.items()
+    }
+
+    # Loot type that receives the rounding remainder for each caravan type
+    _PRIMARY_LOOT = {
+        caravan_type: max(config['loot_types'], key=config['loot_types'].get)
+        for caravan_type, config in TYPE_CONFIGS.items()
+    }
+
     def __init__(self, q: int, r: int, caravan_type: str = None):
         """
         Initialize a caravan
@@ -66,23 +142,26 @@ class Caravan:
             q, r: Hex coordinates
             caravan_type: Type of caravan ('salt', 'gold', 'spices', 'imperial')
         """
+        self.reset(q, r, caravan_type)
+
+    def reset(self, q: int, r: int, caravan_type: str = None):
+        """Reinitialize this caravan in place as a brand new one (used by the caravan pool)"""
+        self._clear_cache()
+
+        self.uid = next(_uid_counter)  # Unique id used to index caravans in GameData, fresh on reuse
         self.q = q
         self.r = r
 
         # Random type if not specified (weighted to avoid rare imperial convoys and sandworm)
         if caravan_type is None:
-            weights = [0.4, 0.35, 0.2, 0.049, 0.001]  # salt, gold, spices, imperial, sandworm
-            caravan_type = random.choices(self.CARAVAN_TYPES, weights=weights)[0]
-        else:
-            caravan_type = caravan_type
+            caravan_type = self.random_types(1)[0]
 
         self.caravan_type = caravan_type
 
         # Generate caravan properties based on type
         self._generate_properties()
 
-        # Movement system
-        self.movement_path: List[Tuple[int, int]] = []
+        # Movement system (target is the next waypoint of a random walk)
         self.last_move_time = time.time()
         self.target_q = q
         self.target_r = r
@@ -92,47 +171,57 @@ class Caravan:
         config = self.TYPE_CONFIGS[self.caravan_type]
         self.is_boss = config.get('boss', False)
         self.max_health = config.get('health', self.escorts * 10)  # Default health based on escorts
+        self.health_percent_factor = 100.0 / self.max_health if self.max_health else 0.0  # health -> percent
         self.current_health = self.max_health
-        self.clan_damage = {}  # clan_id -> damage dealt
-
-        # Generate initial movement path
-        self._generate_movement_path()
+        self.clan_damage = collections.defaultdict(int)  # clan_id -> damage dealt
 
-    def _generate_properties(self):
-        """Generate caravan properties based on type"""
-        config = self.TYPE_CONFIGS[self.caravan_type]
+        # Pick the first waypoint
+        self._pick_next_waypoint()
 
-        self.escorts = random.randint(*config['escorts_range'])
-        self.loot_value = random.randint(*config['loot_range'])
-        self.size = config['size']
-        self.move_interval = config['move_interval']
-        self.loot_types = config['loot_types']
+    def _clear_cache(self):
+        """Forget cached combat strength, difficulty, description and loot
 
-    def _generate_movement_path(self):
-        """Generate a movement path for the caravan"""
-        # Simple random wandering for now
-        # Could be expanded to follow trade routes, avoid danger, etc.
-        self.movement_path = []
+        They are derived from escorts, caravan_type, loot_value and is_scouted,
+        so anything that changes those after reset() must call this.
+        """
+        self._cache_strength = None
+        self._cache_difficulty = None
+        self._cache_desc = None
+        self._cache_loot = None
+
+    @classmethod
+    def random_types(cls, n: int) -> List[str]:
+        """Draw n weighted random caravan types in a single call"""
+        return random.choices(cls.CARAVAN_TYPES, cum_weights=_TYPE_WEIGHTS_CUM, k=n)
+
+    @classmethod
+    def spawn_batch(cls, positions: List[Tuple[int, int, Optional[str]]]) -> List['Caravan']:
+        """
+        Create many caravans at once
 
-        # Generate 5-10 waypoints
-        num_waypoints = random.randint(5, 10)
-        current_q, current_r = self.q, self.r
+        Random types for all positions without a fixed type are drawn in one
+        batch instead of one weighted draw per caravan.
 
-        for _ in range(num_waypoints):
-            # Move in a random direction
-            directions = [(1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1)]
-            dq, dr = random.choice(directions)
+        Args:
+            positions: List of (q, r, caravan_type) tuples, caravan_type may be None
+        """
+        random_types = iter(cls.random_types(sum(1 for _, _, t in positions if t is None)))
+        return [cls(q, r, t if t is not None else next(random_types)) for q, r, t in positions]
 
-            # Move 1-3 hexes in that direction
-            distance = random.randint(1, 3)
-            current_q += dq * distance
-            current_r += dr * distance
+    def _generate_properties(self):
+        """Generate caravan properties based on type"""
+        self._PROPERTY_GENERATORS[self.caravan_type](self)
 
-            self.movement_path.append((current_q, current_r))
+    def _pick_next_waypoint(self):
+        """Pick the next waypoint on demand instead of storing a whole path"""
+        # Simple random wandering for now
+        # Could be expanded to follow trade routes, avoid danger, etc.
+        dq, dr = random.choice(_HEX_DIRS)
 
-        # Set first waypoint as immediate target
-        if self.movement_path:
-            self.target_q, self.target_r = self.movement_path[0]
+        # Move 1-3 hexes in that direction
+        distance = random.choice(_WAYPOINT_DISTANCES)
+        self.target_q = self.q + dq * distance
+        self.target_r = self.r + dr * distance
 
     def update_movement(self, current_time: float):
         """Update caravan position based on time"""
@@ -142,41 +231,33 @@ class Caravan:
 
     def _move_to_next_waypoint(self):
         """Move caravan to next waypoint"""
-        if not self.movement_path:
-            return
-
-        # Move to next waypoint
-        next_q, next_r = self.movement_path[0]
-        self.q, self.r = next_q, next_r
-        self.target_q, self.target_r = self.q, self.r
-
-        # Remove reached waypoint
-        self.movement_path.pop(0)
-
-        # If path is empty, generate new path
-        if not self.movement_path:
-            self._generate_movement_path()
+        self.q, self.r = self.target_q, self.target_r
+        self._pick_next_waypoint()
 
     def get_loot_distribution(self) -> dict:
-        """Get the actual loot distribution for this caravan"""
+        """Get the actual loot distribution for this caravan (treat as read-only)"""
+        if self._cache_loot is not None:
+            return self._cache_loot
+
         if not self.is_scouted:
             # Unscouted caravans show estimated loot
-            return {'estimated': self.loot_value}
+            self._cache_loot = {'estimated': self.loot_value}
+            return self._cache_loot
 
         # Scouted caravans show real distribution
         loot = {}
         remaining_value = self.loot_value
 
-        for loot_type, proportion in self.loot_types.items():
-            amount = int(remaining_value * proportion)
+        for loot_type, percent in self._LOOT_PERCENTS[self.caravan_type]:
+            amount = remaining_value * percent // 100
             if amount > 0:
                 loot[loot_type] = amount
                 remaining_value -= amount
 
         # Add any remainder to primary loot type
-        primary_type = max(self.loot_types.keys(), key=lambda k: self.loot_types[k])
-        loot[primary_type] += remaining_value
+        loot[self._PRIMARY_LOOT[self.caravan_type]] += remaining_value
 
+        self._cache_loot = loot
         return loot
 
     def get_position(self) -> Tuple[int, int]:
@@ -185,33 +266,27 @@ class Caravan:
 
     def get_combat_strength(self) -> int:
         """Calculate combat strength for raiding"""
-        # Base strength from escorts
-        base_strength = self.escorts * 2
-
-        # Bonus based on caravan type
-        type_bonus = {
-            'salt': 1,
-            'gold': 3,
-            'spices': 5,
-            'imperial': 8  # Imperial convoys are much stronger
-        }
+        if self._cache_strength is None:
+            # Base strength from escorts plus bonus based on caravan type
+            base_strength = self.escorts * 2
+            self._cache_strength = base_strength + _TYPE_BONUS.get(self.caravan_type, 0)
 
-        return base_strength + type_bonus.get(self.caravan_type, 0)
+        return self._cache_strength
 
     def get_raid_difficulty(self) -> str:
         """Get difficulty rating for raiding this caravan"""
-        strength = self.get_combat_strength()
-        if strength < 15:
-            return 'easy'
-        elif strength < 30:
-            return 'medium'
-        elif strength < 50:
-            return 'hard'
-        else:
-            return 'legendary'
+        if self._cache_difficulty is None:
+            strength = self.get_combat_strength()
+            index = bisect.bisect_right(_DIFFICULTY_THRESHOLDS, strength)
+            self._cache_difficulty = _DIFFICULTY_LABELS[index]
+
+        return self._cache_difficulty
 
     def get_description(self) -> str:
         """Get a description of the caravan"""
+        if self._cache_desc is not None:
+            return self._cache_desc
+
         config = self.TYPE_CONFIGS[self.caravan_type]
 
         desc = config['name']
@@ -226,11 +301,19 @@ class Caravan:
         else:
             desc += f" ({self.size} size, estimated value: {self.loot_value})"
 
+        self._cache_desc = desc
         return desc
 
     def scout_caravan(self):
         """Mark caravan as scouted"""
         self.is_scouted = True
+        self._clear_cache()
+
+    def restore_cargo(self, escorts: int, loot_value: int):
+        """Replace the generated escorts and loot value, e.g. with saved ones"""
+        self.escorts = escorts
+        self.loot_value = loot_value
+        self._clear_cache()
 
     def __str__(self) -> str:
         return f"Caravan({self.caravan_type}, escorts={self.escorts}, loot={self.loot_value}, scouted={self.is_scouted})"
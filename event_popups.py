@@ -8,6 +8,36 @@ from kivy.uix.button import Button
 from kivy.metrics import dp
 from kivy.clock import Clock
 
+# World boss announcement, filled in from the boss status
+_WORLD_BOSS_MESSAGE = (
+    "The legendary Sandworm has emerged!\n\n"
+    "Health: {health_percent}%\n"
+    "Time Remaining: {time_remaining} hours\n\n"
+    "Damage Dealt: {player_damage}\n\n"
+    "Join your clan to battle this epic foe!"
+)
+
+# Clan assistance request, filled in with the requester and target
+_CLAN_HELP_MESSAGE = (
+    "🏹 {requester_name} needs help raiding a {caravan_type}!\n\n"
+    "Will you send reinforcements?"
+)
+
+# Daily event announcements by event type
+_EVENT_MESSAGES = {
+    'caravan_alert': "🚨 CARAVAN ALERT!\n\nA high-value caravan has been spotted nearby!",
+    'resource_boost': "📈 RESOURCE BOOST!\n\nAll resource generation doubled for 24 hours!",
+    'raid_bonus': "⚔️ RAID BONUS!\n\nAll raids give bonus loot today!"
+}
+
+# Reward announcements by reward type ({amount} is filled in per popup)
+_REWARD_MESSAGES = {
+    'gems': "💎 GEM REWARD!\n\nYou received {amount} gems!",
+    'loot': "💰 LOOT BONUS!\n\nDouble loot activated for your next raid!",
+    'raiders': "⚔️ RAIDERS REVIVED!\n\n{amount} fallen raiders have been revived!",
+    'speed': "⚡ SPEED BOOST!\n\nBuilding upgrades are now 2x faster!"
+}
+
 
 class EventPopup(ModalView):
     """Base class for event notification popups"""
@@ -56,11 +86,11 @@ class WorldBossPopup(EventPopup):
         time_remaining = int(boss_status["time_remaining"] / 3600)  # Hours
 
         title = "🐛 SANDWORM APPEARS!"
-        message = f"The legendary Sandworm has emerged!\n\n" \
-                 f"Health: {health_percent}%\n" \
-                 f"Time Remaining: {time_remaining} hours\n\n" \
-                 f"Damage Dealt: {boss_status['player_damage']}\n\n" \
-                 f"Join your clan to battle this epic foe!"
+        message = _WORLD_BOSS_MESSAGE.format(
+            health_percent=health_percent,
+            time_remaining=time_remaining,
+            player_damage=boss_status['player_damage']
+        )
 
         super().__init__(title, message, "TO BATTLE!", **kwargs)
 
@@ -69,14 +99,8 @@ class DailyEventPopup(EventPopup):
     """Popup for daily events"""
 
     def __init__(self, event_type, **kwargs):
-        event_messages = {
-            'caravan_alert': "🚨 CARAVAN ALERT!\n\nA high-value caravan has been spotted nearby!",
-            'resource_boost': "📈 RESOURCE BOOST!\n\nAll resource generation doubled for 24 hours!",
-            'raid_bonus': "⚔️ RAID BONUS!\n\nAll raids give bonus loot today!"
-        }
-
         title = "🎉 DAILY EVENT"
-        message = event_messages.get(event_type, "A special daily event is active!")
+        message = _EVENT_MESSAGES.get(event_type, "A special daily event is active!")
 
         super().__init__(title, message, "LET'S GO!", **kwargs)
 
@@ -98,15 +122,9 @@ class RewardPopup(EventPopup):
     """Popup for showing rewards"""
 
     def __init__(self, reward_type, amount, **kwargs):
-        reward_messages = {
-            'gems': f"💎 GEM REWARD!\n\nYou received {amount} gems!",
-            'loot': f"💰 LOOT BONUS!\n\nDouble loot activated for your next raid!",
-            'raiders': f"⚔️ RAIDERS REVIVED!\n\n{amount} fallen raiders have been revived!",
-            'speed': f"⚡ SPEED BOOST!\n\nBuilding upgrades are now 2x faster!"
-        }
-
         title = "🎁 REWARD CLAIMED"
-        message = reward_messages.get(reward_type, f"You received: {amount}")
+        template = _REWARD_MESSAGES.get(reward_type)
+        message = template.format(amount=amount) if template else f"You received: {amount}"
 
         super().__init__(title, message, "AWESOME!", **kwargs)
 
@@ -116,12 +134,21 @@ class ClanHelpPopup(EventPopup):
 
     def __init__(self, requester_name, caravan_type, **kwargs):
         title = "🤝 CLAN ASSISTANCE REQUEST"
-        message = f"🏹 {requester_name} needs help raiding a {caravan_type}!\n\n" \
-                 f"Will you send reinforcements?"
+        message = _CLAN_HELP_MESSAGE.format(requester_name=requester_name, caravan_type=caravan_type)
 
         super().__init__(title, message, "SEND HELP", **kwargs)
 
 
+# Popup class for each popup type accepted by show_event_popup
+_POPUP_CLASSES = {
+    'world_boss': WorldBossPopup,
+    'daily_event': DailyEventPopup,
+    'weekly_event': WeeklyEventPopup,
+    'reward': RewardPopup,
+    'clan_help': ClanHelpPopup
+}
+
+
 def show_event_popup(popup_type: str, **kwargs):
     """
     Convenience function to show different types of event popups
@@ -130,16 +157,8 @@ def show_event_popup(popup_type: str, **kwargs):
         popup_type: Type of popup ('world_boss', 'daily_event', 'weekly_event', 'reward', 'clan_help')
         **kwargs: Arguments specific to each popup type
     """
-    popup_classes = {
-        'world_boss': WorldBossPopup,
-        'daily_event': DailyEventPopup,
-        'weekly_event': WeeklyEventPopup,
-        'reward': RewardPopup,
-        'clan_help': ClanHelpPopup
-    }
-
-    if popup_type in popup_classes:
-        popup = popup_classes[popup_type](**kwargs)
+    if popup_type in _POPUP_CLASSES:
+        popup = _POPUP_CLASSES[popup_type](**kwargs)
         popup.open()
     else:
         print(f"Unknown popup type: {popup_type}")
@@ -3,6 +3,9 @@ Firebase configuration for Sahara Raiders
 Contains placeholder config - replace with real Firebase project details
 """
 import os
+import queue
+import threading
+import time
 from typing import Dict, Any
 
 # Firebase Realtime Database configuration
@@ -28,20 +31,27 @@ DB_PATHS = {
 
 # Firebase initialization flag
 firebase_initialized = False
+firebase_app = None
 firebase_db = None
 
+# Queued writes are merged and sent as one multi-path update per interval
+WRITE_FLUSH_INTERVAL = 0.1  # seconds
+_write_queue = queue.Queue()
+_write_worker = None
+_write_worker_lock = threading.Lock()
+
 def initialize_firebase():
     """
     Initialize Firebase connection
     Returns True if successful, False if offline/fallback mode
     """
-    global firebase_initialized, firebase_db
+    global firebase_initialized, firebase_app, firebase_db
 
     try:
         import pyrebase
 
-        firebase = pyrebase.initialize_app(FIREBASE_CONFIG)
-        firebase_db = firebase.database()
+        firebase_app = pyrebase.initialize_app(FIREBASE_CONFIG)
+        firebase_db = firebase_app.database()
         firebase_initialized = True
         print("Firebase initialized successfully")
         return True
@@ -57,6 +67,16 @@ def initialize_firebase():
         firebase_initialized = False
         return False
 
+def initialize_firebase_async() -> threading.Thread:
+    """
+    Initialize Firebase on a background thread so app startup isn't blocked
+    by the pyrebase import and connection. The game stays in offline mode
+    until initialization finishes.
+    """
+    thread = threading.Thread(target=initialize_firebase, name="firebase-init", daemon=True)
+    thread.start()
+    return thread
+
 def is_online() -> bool:
     """Check if Firebase is connected"""
     return firebase_initialized
@@ -84,3 +104,49 @@ def safe_firebase_operation(operation_func, fallback_result=None):
     except Exception as e:
         print(f"Firebase operation failed: {e}")
         return fallback_result
+
+def queue_firebase_update(path: str, value: Any):
+    """
+    Queue a write of value to a database path without blocking the caller
+
+    Writes queued within WRITE_FLUSH_INTERVAL of each other are sent as a
+    single multi-path update; a later write to the same path replaces an
+    earlier one. Writes made while offline are dropped.
+
+    Args:
+        path: Database path, e.g. "players/<player_id>"
+        value: Data to store at that path
+    """
+    global _write_worker
+
+    _write_queue.put((path, value))
+
+    with _write_worker_lock:
+        if _write_worker is None:
+            _write_worker = threading.Thread(target=_write_loop, name="firebase-writes", daemon=True)
+            _write_worker.start()
+
+def _write_loop():
+    """Drain the write queue, sending one batched update per interval"""
+    # child() changes the path stored on a pyrebase Database, so the worker
+    # uses its own handle instead of sharing firebase_db with the main thread
+    write_db = None
+    while True:
+        path, value = _write_queue.get()
+        batch = {path: value}
+
+        # Collect everything else queued during the flush interval
+        deadline = time.monotonic() + WRITE_FLUSH_INTERVAL
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                path, value = _write_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch[path] = value
+
+        if write_db is None and is_online():
+            write_db = firebase_app.database()
+        safe_firebase_operation(lambda: write_db.update(batch))
@@ -1,17 +1,127 @@
 """
 Game Data module - Manages global game state, resources, save/load
 """
+import collections
+import copy
+import heapq
 import json
+import operator
 import os
 import random
 import time
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Dict, List, Any, Tuple, Optional, Sequence
 from caravan import Caravan
+from firebase_config import queue_firebase_update, DB_PATHS
+from utils import ProceduralGenerator, hex_range
+
+# orjson is optional - much faster (de)serialization, stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# msgpack is optional - compact binary saves when installed, JSON otherwise
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+# Event durations in seconds
+_WORLD_BOSS_DURATION = 7 * 24 * 60 * 60  # 7 days
+_DAILY_EVENT_DURATION = 24 * 60 * 60  # 24 hours
+_WEEKLY_EVENT_DURATION = 7 * 24 * 60 * 60  # 7 days
+
+# Daily event kinds start_daily_event picks from
+_DAILY_EVENT_TYPES = ('caravan_alert', 'resource_boost', 'raid_bonus')
+
+# Shared result of get_active_events while nothing is running
+_EMPTY_EVENTS: Tuple[Dict[str, Any], ...] = ()
+
+# Resource generation multiplier while the resource_boost daily event runs
+_RESOURCE_BOOST_MULTIPLIER = 2.0
+
+# Set DEBUG_SAVE=1 to write indented, human-readable JSON saves
+_PRETTY_SAVES = bool(os.environ.get('DEBUG_SAVE'))
+
+
+def _pack_hex(q: int, r: int) -> int:
+    """Pack axial hex coordinates into a single int (q in the high 32 bits)"""
+    return (q << 32) | (r & 0xFFFFFFFF)
+
+
+def _unpack_hex(key: int) -> Tuple[int, int]:
+    """Unpack an int produced by _pack_hex back into (q, r)"""
+    r = key & 0xFFFFFFFF
+    if r >= 0x80000000:
+        r -= 0x100000000
+    return (key >> 32, r)
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize data to compact single-line JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _dump(data: Dict[str, Any], f):
+    """Stream save data into a binary file (msgpack if available, else JSON)"""
+    if msgpack is not None:
+        f.write(msgpack.packb(data, use_bin_type=True))
+        return
+    if orjson is not None:
+        # Single C buffer, no str copy
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2) if _PRETTY_SAVES else orjson.dumps(data))
+        return
+    # iterencode yields small chunks, so the whole document is never held as one string
+    if _PRETTY_SAVES:
+        encoder = json.JSONEncoder(indent=2)
+    else:
+        encoder = json.JSONEncoder(separators=(',', ':'))
+    f.writelines(chunk.encode('utf-8') for chunk in encoder.iterencode(data))
+
+
+def _loads(payload: bytes) -> Dict[str, Any]:
+    """Parse save data from JSON or msgpack bytes"""
+    if payload[:1] != b'{':
+        if msgpack is None:
+            raise ValueError("save file is msgpack but msgpack is not installed")
+        return msgpack.unpackb(payload, raw=False)
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _legacy_caravan_row(caravan_data: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Flatten a per-caravan save entry (saves before version 6) into a column row"""
+    target = caravan_data.get('target')
+    if target is None and caravan_data.get('movement_path'):
+        target = caravan_data['movement_path'][0]  # Older saves store the whole path
+    target_q, target_r = target if target is not None else (None, None)
+    return (
+        caravan_data['q'], caravan_data['r'], caravan_data['type'],
+        caravan_data['escorts'], caravan_data['loot_value'], target_q, target_r,
+        caravan_data.get('last_move_time', time.time())
+    )
+
+
+def _scaled_cost(base_cost: Dict[str, int], level: int) -> Dict[str, int]:
+    """Upgrade cost of a building at level, from its base cost"""
+    multiplier = 1.5 ** (level - 1)  # Exponential scaling
+    return {resource: int(amount * multiplier) for resource, amount in base_cost.items()}
+
+
+def _scaled_effects(base_effects: Dict[str, float], level: int) -> Dict[str, float]:
+    """Effects of a building at level, from its per-level effects"""
+    return {effect: value * level for effect, value in base_effects.items()}
 
 
 class Hero:
     """Represents a hero with abilities and stats"""
 
+    __slots__ = ('name', 'portrait', 'description', 'bonuses', 'level', 'available', '_raid_bonuses')
+
     def __init__(self, name: str, portrait: str, description: str, bonuses: Dict[str, float]):
         self.name = name
         self.portrait = portrait
@@ -19,15 +129,18 @@ class Hero:
         self.bonuses = bonuses  # Dict of stat bonuses (e.g., {'raid_success': 0.2})
         self.level = 1
         self.available = True  # Can be assigned to raids
+        self._raid_bonuses = {k: v for k, v in bonuses.items() if k.startswith('raid_')}
 
     def get_raid_bonus(self) -> Dict[str, float]:
-        """Get bonuses that apply to raids"""
-        return {k: v for k, v in self.bonuses.items() if k.startswith('raid_')}
+        """Get bonuses that apply to raids (shared dict, don't mutate)"""
+        return self._raid_bonuses
 
 
 class Building:
     """Represents a building in the camp"""
 
+    __slots__ = ('building_type', 'level', 'upgrade_cost', 'upgrade_cost_items')
+
     BUILDING_TYPES = {
         'tent': {
             'name': 'Tent',
@@ -66,21 +179,49 @@ class Building:
         }
     }
 
+    # Upgrade cost per (type, level), shared between buildings so treat as read-only
+    _UPGRADE_COSTS = {
+        (building_type, level): _scaled_cost(config['base_cost'], level)
+        for building_type, config in BUILDING_TYPES.items()
+        for level in range(1, config['max_level'] + 1)
+    }
+
+    # Effects per (type, level), shared between buildings so treat as read-only
+    _EFFECTS = {
+        (building_type, level): _scaled_effects(config['effects'], level)
+        for building_type, config in BUILDING_TYPES.items()
+        for level in range(1, config['max_level'] + 1)
+    }
+
     def __init__(self, building_type: str, level: int = 1):
         self.building_type = building_type
         self.level = level
+        self.refresh_upgrade_cost()
+
+    def refresh_upgrade_cost(self):
+        """Recompute upgrade_cost (and its packed pairs) for the current level"""
         self.upgrade_cost = self.calculate_upgrade_cost()
+        self.upgrade_cost_items = tuple(self.upgrade_cost.items())  # ((resource, amount), ...)
 
     def calculate_upgrade_cost(self) -> Dict[str, int]:
-        """Calculate cost to upgrade this building"""
-        base_cost = self.BUILDING_TYPES[self.building_type]['base_cost']
-        multiplier = 1.5 ** (self.level - 1)  # Exponential scaling
-        return {resource: int(amount * multiplier) for resource, amount in base_cost.items()}
+        """Calculate cost to upgrade this building (shared dict, don't mutate)"""
+        key = (self.building_type, self.level)
+        cost = self._UPGRADE_COSTS.get(key)
+        if cost is None:  # Level outside the table, e.g. from an edited save
+            cost = self._UPGRADE_COSTS[key] = _scaled_cost(
+                self.BUILDING_TYPES[self.building_type]['base_cost'], self.level
+            )
+        return cost
 
     def get_effects(self) -> Dict[str, float]:
-        """Get current effects of this building"""
-        base_effects = self.BUILDING_TYPES[self.building_type]['effects']
-        return {effect: value * self.level for effect, value in base_effects.items()}
+        """Get current effects of this building (shared dict, don't mutate)"""
+        key = (self.building_type, self.level)
+        effects = self._EFFECTS.get(key)
+        if effects is None:  # Level outside the table, e.g. from an edited save
+            effects = self._EFFECTS[key] = _scaled_effects(
+                self.BUILDING_TYPES[self.building_type]['effects'], self.level
+            )
+        return effects
 
 
 class TechTree:
@@ -125,13 +266,95 @@ class TechTree:
         return self.TECH_BRANCHES[branch]['tiers'][tier]['cost']
 
 
+def _start_caravan_alert(game_data: 'GameData'):
+    """Daily event: spawn a guaranteed high-value caravan"""
+    game_data.spawn_caravan(random.randint(-10, 10), random.randint(-10, 10), 'gold')
+    print("DAILY EVENT: Caravan Alert! High-value caravan spotted!")
+
+
+def _start_resource_boost(game_data: 'GameData'):
+    """Daily event: double resource generation for 24 hours"""
+    game_data.resource_rate_multiplier = _RESOURCE_BOOST_MULTIPLIER
+    print("DAILY EVENT: Resource Boost! 2x resource generation!")
+
+
+def _end_resource_boost(game_data: 'GameData'):
+    """Restore normal resource rates"""
+    game_data.resource_rate_multiplier = 1.0
+
+
+def _start_raid_bonus(game_data: 'GameData'):
+    """Daily event: bonus raid rewards"""
+    print("DAILY EVENT: Raid Bonus! All raids give bonus loot!")
+
+
+# Daily event type -> setup, and teardown for the types that need one
+_DAILY_START_HANDLERS = {
+    'caravan_alert': _start_caravan_alert,
+    'resource_boost': _start_resource_boost,
+    'raid_bonus': _start_raid_bonus
+}
+_DAILY_END_HANDLERS = {
+    'resource_boost': _end_resource_boost
+}
+
+
 class GameData:
     """Central game state management class"""
 
-    SAVE_FILE = "sahara_save.json"
+    # player_id and clan_id are properties backed by _player_id and _clan_id
+    __slots__ = (
+        'resources', 'resource_rates', 'resource_rate_multiplier', 'resource_timers',
+        'raiders_available', 'max_raiders', 'heroes', '_hero_bonus_totals',
+        'camp_buildings', 'buildings_version', '_effect_totals', '_building_level_total', 'tech_tree',
+        '_player_id', '_clan_id', '_contributor_id', 'player_name', 'clan_tag',
+        'world_boss_active', 'world_boss_end_time', 'world_boss_caravan', 'clan_damage_contributed',
+        '_boss_status_cache', '_boss_status_time', '_pending_boss_damage', '_pending_boss_hits',
+        '_last_boss_damage_flush',
+        'daily_event_active', 'daily_event_end_time', 'daily_event_type', 'daily_event_display_name',
+        'weekly_event_active', 'weekly_event_end_time', 'weekly_event_type',
+        '_event_heap', '_next_event_check', '_dirty_event_fields',
+        'gems', 'double_loot_active', 'upgrade_speed_multiplier', 'last_raid_losses',
+        'battle_pass_tier', 'battle_pass_xp',
+        '_caravans', 'hex_index', '_move_heap', '_caravan_pool', 'explored_hexes', '_explored_delta',
+        'map_features', 'camp_q', 'camp_r', 'water_consumption_rate',
+        'sandstorm_active', 'last_sandstorm_check', 'sandstorm_check_interval', 'sandstorm_duration',
+        '_tick_time', '_dirty', '_last_save_time', '_last_saved_snapshot', '_base_rev', '_saves_since_base'
+    )
+
+    CAMP_SIZE = 8  # Camp grid is CAMP_SIZE x CAMP_SIZE
+    AUTOSAVE_INTERVAL = 5.0  # Min seconds between maybe_save writes
+    EVENT_CHECK_INTERVAL = 1.0  # Seconds between event timer checks in update()
+    BOSS_DAMAGE_FLUSH_HITS = 40  # Send pending world boss damage after this many hits...
+    BOSS_DAMAGE_FLUSH_INTERVAL = 2.0  # ...or once it is this many seconds old
+    CARAVAN_POOL_SIZE = 64  # Max removed caravans kept around for reuse
+    SAVE_FILE = "sahara_save.msgpack" if msgpack is not None else "sahara_save.json"
+    JSON_SAVE_FILE = "sahara_save.json"  # Older saves, still loaded when SAVE_FILE is missing
+    SAVE_DELTA_FILE = "sahara_save.delta"  # One JSON delta record per line, replayed over SAVE_FILE
+    SAVE_VERSION = 6  # Bump when the save layout changes; saves without a version are 1
+    FULL_SAVE_INTERVAL = 50  # Rewrite the full base after this many delta checkpoints
+    _ITEM_DIFF_SECTIONS = ('camp_buildings',)  # Dict sections diffed per key
+    # Fields that move on every save; a change to these alone doesn't warrant a delta record.
+    # An empty tuple marks the whole key, otherwise the listed fields of a dict section
+    _VOLATILE_SAVE_FIELDS = {'last_water_update': (), 'visible_caravans': ('last_move_times',)}
+
+    # Timed events: kind -> (active flag, end time attribute, end method)
+    _TIMED_EVENTS = {
+        'daily': ('daily_event_active', 'daily_event_end_time', 'end_daily_event'),
+        'weekly': ('weekly_event_active', 'weekly_event_end_time', 'end_weekly_event'),
+        'world_boss': ('world_boss_active', 'world_boss_end_time', 'end_world_boss_event')
+    }
 
     def __init__(self):
-        """Initialize game data with default values"""
+        """Initialize game data, from the save file if there is one"""
+        self._reset_state()
+        if self._existing_save_file() is None:
+            self.initialize_world()
+        else:
+            self.load_game()
+
+    def _reset_state(self):
+        """Set every field to its new-game default, without touching the world or the save"""
         # Resources
         self.resources = {
             'water': 100,
@@ -149,6 +372,8 @@ class GameData:
             'slaves': 0.0  # Slaves don't generate automatically
         }
 
+        self.resource_rate_multiplier = 1.0  # Applied on top of resource_rates, e.g. by events
+
         self.resource_timers = {
             'water': 0.0,
             'salt': 0.0,
@@ -163,14 +388,22 @@ class GameData:
 
         # Heroes system
         self.heroes = self._create_heroes()
+        self._hero_bonus_totals: Dict[str, float] = {}  # bonus -> sum over available heroes
+        self._rebuild_hero_bonus_totals()
 
-        # Building system (8x8 camp grid)
-        self.camp_buildings: Dict[Tuple[int, int], Building] = {}  # (x, y) -> Building
+        # Building system (8x8 camp grid), flat slots indexed by y * CAMP_SIZE + x
+        self.camp_buildings: List[Optional[Building]] = [None] * (self.CAMP_SIZE * self.CAMP_SIZE)
+        self.buildings_version = 0  # Bumped whenever a building is placed or changes level
+        self._effect_totals: Dict[str, float] = {}  # effect -> sum over all buildings
+        self._building_level_total = 0  # Sum of all building levels, for the power level
 
         # Tech tree
         self.tech_tree = TechTree()
 
         # Multiplayer features
+        self._player_id = None
+        self._clan_id = None
+        self._contributor_id = None  # clan_id or player_id, kept up to date by their setters
         self.player_id = None  # Will be set to UUID
         self.player_name = "Desert Raider"  # Default name
         self.clan_id = None
@@ -181,14 +414,23 @@ class GameData:
         self.world_boss_end_time = 0
         self.world_boss_caravan = None
         self.clan_damage_contributed = 0
+        self._boss_status_cache: Optional[Dict[str, Any]] = None  # Built for _boss_status_time
+        self._boss_status_time = 0.0
+        self._pending_boss_damage: Dict[str, int] = collections.defaultdict(int)  # clan id -> unsent damage
+        self._pending_boss_hits = 0
+        self._last_boss_damage_flush = 0.0
 
         # Events system
         self.daily_event_active = False
         self.daily_event_end_time = 0
         self.daily_event_type = None
+        self.daily_event_display_name = None  # Pretty daily_event_type, built once per event
         self.weekly_event_active = False
         self.weekly_event_end_time = 0
         self.weekly_event_type = None
+        self._event_heap: List[Tuple[float, str]] = []  # (end time, kind), earliest first
+        self._next_event_check = 0.0  # Tick time update() checks the event timers again
+        self._dirty_event_fields: set = set()  # Event attributes changed since the last sync
 
         # Monetization
         self.gems = 100  # Starting gems for testing
@@ -201,8 +443,12 @@ class GameData:
         self.battle_pass_xp = 0
 
         # World state
-        self.visible_caravans: List[Caravan] = []
-        self.explored_hexes: set = set()
+        self._caravans: Dict[int, Caravan] = {}  # caravan uid -> Caravan
+        self.hex_index: Dict[Tuple[int, int], List[Caravan]] = {}  # (q, r) -> caravans on that hex
+        self._move_heap: List[Tuple[float, int, Caravan]] = []  # (next move time, uid, caravan)
+        self._caravan_pool: List[Caravan] = []  # Removed caravans ready to be reset and reused
+        self.explored_hexes: set = set()  # Packed hex keys, see _pack_hex
+        self._explored_delta: set = set()  # Explored since the last save checkpoint
 
         # Map features (oases, dunes, ruins)
         self.map_features: Dict[Tuple[int, int], str] = {}  # (q, r) -> feature_type
@@ -212,20 +458,25 @@ class GameData:
         self.camp_r = 0
 
         # Water consumption (based on population)
-        self.last_water_update = time.time()
         self.water_consumption_rate = 0.1  # Water per second per person
 
         # Sandstorm system
         self.sandstorm_active = False
         self.last_sandstorm_check = time.time()
+        self.sandstorm_check_interval = random.uniform(300, 900)  # Rolled once per check, not per frame
         self.sandstorm_duration = 0
 
-        # Initialize world if not loading from save
-        if not os.path.exists(self.SAVE_FILE):
-            self.initialize_world()
+        # Clock reading shared by everything in the current tick, see update_tick_time
+        self._tick_time = time.time()
 
-        # Load saved game if exists
-        self.load_game()
+        # Autosave - set by state-changing actions, cleared by save_game
+        self._dirty = False
+        self._last_save_time = 0.0
+
+        # Delta checkpoints - copy of the state last written to disk
+        self._last_saved_snapshot: Optional[Dict[str, Any]] = None
+        self._base_rev = 0
+        self._saves_since_base = 0
 
     def _create_heroes(self) -> List[Hero]:
         """Create the starting heroes"""
@@ -264,8 +515,6 @@ class GameData:
 
     def initialize_world(self):
         """Initialize the game world with procedural features and caravans"""
-        from utils import ProceduralGenerator
-
         # Generate map features
         self.map_features = ProceduralGenerator.generate_desert_features(radius=15)
 
@@ -273,16 +522,16 @@ class GameData:
         caravan_positions = ProceduralGenerator.generate_starting_caravans(radius=15)
 
         # Create caravan objects
-        from caravan import Caravan
-        for q, r, caravan_type in caravan_positions:
-            caravan = Caravan(q, r, caravan_type)
-            self.visible_caravans.append(caravan)
+        for caravan in Caravan.spawn_batch(caravan_positions):
+            self.add_caravan(caravan)
 
         print(f"Initialized world with {len(self.map_features)} features and {len(self.visible_caravans)} caravans")
 
     def update(self, dt: float):
         """Update game state each frame"""
-        current_time = time.time()
+        # Advance the tick clock by dt, it is resynced with the wall clock below
+        self._tick_time += dt
+        current_time = self._tick_time
 
         # Generate resources over time
         self.generate_resources(dt)
@@ -291,20 +540,41 @@ class GameData:
         self.update_water_consumption(dt)
 
         # Update sandstorm system
-        self.update_sandstorm(current_time)
+        self.update_sandstorm(dt)
 
         # Update idle building production
         self.update_building_production(dt)
 
+        # End events whose time is up, events last days so once a second is plenty.
+        # Event end times are wall clock stamps, so read the real clock here
+        if current_time >= self._next_event_check:
+            current_time = self.update_tick_time()
+            self._next_event_check = current_time + self.EVENT_CHECK_INTERVAL
+            self.check_event_timers(current_time)
+
+    def update_tick_time(self) -> float:
+        """Read the clock once and share it with status queries until the next tick"""
+        self._tick_time = time.time()
+        return self._tick_time
+
     def generate_resources(self, dt: float):
         """Generate resources based on rates and time"""
+        resources = self.resources
+        timers = self.resource_timers
+        scaled_dt = self.resource_rate_multiplier * dt
+
         for resource, rate in self.resource_rates.items():
-            self.resource_timers[resource] += rate * dt
+            if not rate:
+                continue  # e.g. slaves, which never generate on their own
+
+            timer = timers[resource] + rate * scaled_dt
 
             # Generate resource when timer reaches threshold
-            if self.resource_timers[resource] >= 100:  # 100 units = 1 resource
-                self.resource_timers[resource] -= 100
-                self.resources[resource] += 1
+            if timer >= 100:  # 100 units = 1 resource
+                timer -= 100
+                resources[resource] += 1
+
+            timers[resource] = timer
 
     def update_water_consumption(self, dt: float):
         """Update water consumption based on population"""
@@ -320,13 +590,14 @@ class GameData:
             # Reduce raider efficiency, increased desertion chance
             self.raiders_available = max(1, self.raiders_available - 1)  # Lose 1 raider per update when dehydrated
 
-    def update_sandstorm(self, current_time: float):
+    def update_sandstorm(self, dt: float):
         """Update sandstorm system"""
         # Check for sandstorm every 5-15 minutes
-        time_since_last_check = current_time - self.last_sandstorm_check
+        time_since_last_check = self._tick_time - self.last_sandstorm_check
 
-        if time_since_last_check > random.uniform(300, 900):  # 5-15 minutes
-            self.last_sandstorm_check = current_time
+        if time_since_last_check > self.sandstorm_check_interval:  # 5-15 minutes
+            self.last_sandstorm_check = self._tick_time
+            self.sandstorm_check_interval = random.uniform(300, 900)
 
             # 20% chance of sandstorm
             if random.random() < 0.2:
@@ -334,16 +605,15 @@ class GameData:
 
         # Update active sandstorm
         if self.sandstorm_active:
-            self.sandstorm_duration -= (current_time - self.last_water_update)
+            self.sandstorm_duration -= dt
 
             if self.sandstorm_duration <= 0:
                 self.end_sandstorm()
 
-        self.last_water_update = current_time
-
     def start_sandstorm(self):
         """Start a sandstorm event"""
         self.sandstorm_active = True
+        self._dirty = True
         self.sandstorm_duration = random.uniform(30, 120)  # 30 seconds to 2 minutes
 
         # Sandstorm effects: damage buildings if not fortified
@@ -351,14 +621,17 @@ class GameData:
         damage_chance = max(0.1, 0.3 - defense_bonus)  # 30% base chance, reduced by fortifications
 
         damaged_buildings = []
-        for pos, building in self.camp_buildings.items():
-            if random.random() < damage_chance:
-                # Reduce building level (can't go below 1)
-                if building.level > 1:
-                    building.level -= 1
-                    damaged_buildings.append(building.BUILDING_TYPES[building.building_type]['name'])
+        rand = random.random
+        for building in self.camp_buildings:
+            # Reduce building level (can't go below 1), level 1 buildings don't need a roll
+            if building is not None and building.level > 1 and rand() < damage_chance:
+                self._add_building_effects(building, -1)
+                building.level -= 1
+                self._add_building_effects(building, 1)
+                damaged_buildings.append(Building.BUILDING_TYPES[building.building_type]['name'])
 
         if damaged_buildings:
+            self.buildings_version += 1
             print(f"Sandstorm damaged: {', '.join(damaged_buildings)}")
 
     def end_sandstorm(self):
@@ -380,56 +653,80 @@ class GameData:
 
     def get_total_building_effect(self, effect_type: str) -> float:
         """Get total effect from all buildings of a certain type"""
-        total = 0.0
-        for building in self.camp_buildings.values():
-            effects = building.get_effects()
-            total += effects.get(effect_type, 0)
-        return total
+        return self._effect_totals.get(effect_type, 0.0)
+
+    def _add_building_effects(self, building: Building, sign: int):
+        """Add (sign=1) or remove (sign=-1) a building's effects from the running totals"""
+        totals = self._effect_totals
+        for effect, value in building.get_effects().items():
+            totals[effect] = totals.get(effect, 0.0) + sign * value
+        self._building_level_total += sign * building.level
+
+    def _rebuild_effect_totals(self):
+        """Recompute the effect totals from scratch, e.g. after loading"""
+        self._effect_totals = {}
+        self._building_level_total = 0
+        for building in self.camp_buildings:
+            if building is not None:
+                self._add_building_effects(building, 1)
+
+    def get_building(self, x: int, y: int) -> Optional[Building]:
+        """Get the building at camp coordinates, None if empty or off the grid"""
+        if not (0 <= x < self.CAMP_SIZE and 0 <= y < self.CAMP_SIZE):
+            return None
+        return self.camp_buildings[y * self.CAMP_SIZE + x]
 
     def place_building(self, x: int, y: int, building_type: str) -> bool:
         """Place a new building at camp coordinates"""
-        pos = (x, y)
-
-        # Check if position is valid and empty
-        if pos in self.camp_buildings:
+        # Check bounds (8x8 grid)
+        if not (0 <= x < self.CAMP_SIZE and 0 <= y < self.CAMP_SIZE):
             return False
 
-        # Check bounds (8x8 grid)
-        if not (0 <= x < 8 and 0 <= y < 8):
+        # Check if position is empty
+        idx = y * self.CAMP_SIZE + x
+        if self.camp_buildings[idx] is not None:
             return False
 
         # Create building
         building = Building(building_type)
-        self.camp_buildings[pos] = building
+        self.camp_buildings[idx] = building
+        self.buildings_version += 1
+        self._add_building_effects(building, 1)
 
         # Update derived stats
         self.update_derived_stats()
+        self._dirty = True
         return True
 
     def upgrade_building(self, x: int, y: int) -> bool:
         """Upgrade building at camp coordinates"""
-        pos = (x, y)
-
-        if pos not in self.camp_buildings:
+        building = self.get_building(x, y)
+        if building is None:
             return False
 
-        building = self.camp_buildings[pos]
         if building.level >= building.BUILDING_TYPES[building.building_type]['max_level']:
             return False
 
         # Check if can afford upgrade
-        if not self.can_afford(building.upgrade_cost):
+        cost_items = building.upgrade_cost_items
+        if not self.can_afford_items(cost_items):
             return False
 
         # Spend resources
-        self.spend_resources(building.upgrade_cost)
+        resources = self.resources
+        for resource, amount in cost_items:
+            resources[resource] -= amount
 
         # Upgrade building
+        self._add_building_effects(building, -1)
         building.level += 1
-        building.upgrade_cost = building.calculate_upgrade_cost()
+        self._add_building_effects(building, 1)
+        building.refresh_upgrade_cost()
+        self.buildings_version += 1
 
         # Update derived stats
         self.update_derived_stats()
+        self._dirty = True
         return True
 
     def update_derived_stats(self):
@@ -466,16 +763,26 @@ class GameData:
         if raiders_gained > 0:
             self.resources['slaves'] -= num_slaves
             self.raiders_available += raiders_gained
+            self._dirty = True
 
         return raiders_gained
 
     def get_hero_bonus(self, bonus_type: str) -> float:
-        """Get total bonus from all heroes for a specific type"""
-        total_bonus = 0.0
+        """Get total bonus from all available heroes for a specific type"""
+        return self._hero_bonus_totals.get(bonus_type, 0.0)
+
+    def _add_hero_bonuses(self, hero: Hero, sign: int):
+        """Add (sign=1) or remove (sign=-1) a hero's bonuses from the running totals"""
+        totals = self._hero_bonus_totals
+        for bonus, value in hero.bonuses.items():
+            totals[bonus] = totals.get(bonus, 0.0) + sign * value
+
+    def _rebuild_hero_bonus_totals(self):
+        """Recompute the hero bonus totals from scratch, e.g. after loading"""
+        self._hero_bonus_totals = {}
         for hero in self.heroes:
             if hero.available:  # Only count available heroes
-                total_bonus += hero.bonuses.get(bonus_type, 0)
-        return total_bonus
+                self._add_hero_bonuses(hero, 1)
 
     def assign_heroes_to_raid(self, hero_indices: List[int]) -> List[Hero]:
         """Assign heroes to a raid (makes them unavailable)"""
@@ -484,13 +791,18 @@ class GameData:
             if 0 <= idx < len(self.heroes) and self.heroes[idx].available:
                 hero = self.heroes[idx]
                 hero.available = False
+                self._add_hero_bonuses(hero, -1)
+                self._dirty = True
                 assigned_heroes.append(hero)
         return assigned_heroes
 
     def return_heroes_from_raid(self, heroes: List[Hero]):
         """Return heroes from raid (makes them available again)"""
         for hero in heroes:
-            hero.available = True
+            if not hero.available:
+                hero.available = True
+                self._add_hero_bonuses(hero, 1)
+                self._dirty = True
 
     def can_afford(self, cost: Dict[str, int]) -> bool:
         """Check if player can afford a cost"""
@@ -499,6 +811,14 @@ class GameData:
                 return False
         return True
 
+    def can_afford_items(self, cost_items: Tuple[Tuple[str, int], ...]) -> bool:
+        """Check if player can afford a cost given as (resource, amount) pairs"""
+        resources = self.resources
+        for resource, amount in cost_items:
+            if resources.get(resource, 0) < amount:
+                return False
+        return True
+
     def spend_resources(self, cost: Dict[str, int]) -> bool:
         """Spend resources if affordable"""
         if not self.can_afford(cost):
@@ -506,20 +826,159 @@ class GameData:
 
         for resource, amount in cost.items():
             self.resources[resource] -= amount
+        self._dirty = True
         return True
 
+    @property
+    def player_id(self) -> Optional[str]:
+        """This player's id"""
+        return self._player_id
+
+    @player_id.setter
+    def player_id(self, value: Optional[str]):
+        self._player_id = value
+        self._contributor_id = self._clan_id or value
+        self._boss_status_cache = None  # player_damage depends on the contributor
+
+    @property
+    def clan_id(self) -> Optional[str]:
+        """Id of the clan the player belongs to, None if not in a clan"""
+        return self._clan_id
+
+    @clan_id.setter
+    def clan_id(self, value: Optional[str]):
+        self._clan_id = value
+        self._contributor_id = value or self._player_id
+        self._boss_status_cache = None  # player_damage depends on the contributor
+
+    @property
+    def visible_caravans(self):
+        """Read-only view of visible caravans in spawn order"""
+        return self._caravans.values()
+
     def add_caravan(self, caravan: Caravan):
         """Add a caravan to the visible list"""
-        self.visible_caravans.append(caravan)
+        self._caravans[caravan.uid] = caravan
+        self.hex_index.setdefault((caravan.q, caravan.r), []).append(caravan)
+        self._schedule_move(caravan)
+        self._dirty = True
 
     def remove_caravan(self, caravan: Caravan):
-        """Remove a caravan from the visible list"""
-        if caravan in self.visible_caravans:
-            self.visible_caravans.remove(caravan)
+        """Remove a caravan from the visible list and keep it for reuse"""
+        if self._caravans.pop(caravan.uid, None) is not None:
+            self._unindex_caravan(caravan, (caravan.q, caravan.r))
+            self._dirty = True
+            # Its heap entry goes stale on its own, a reused caravan gets a new uid
+            if len(self._caravan_pool) < self.CARAVAN_POOL_SIZE:
+                self._caravan_pool.append(caravan)
+
+    def _acquire_caravan(self, q: int, r: int, caravan_type: str = None) -> Caravan:
+        """Get a fresh caravan, reusing a pooled one when available"""
+        if self._caravan_pool:
+            caravan = self._caravan_pool.pop()
+            caravan.reset(q, r, caravan_type)
+            return caravan
+        return Caravan(q, r, caravan_type)
+
+    def spawn_caravan(self, q: int, r: int, caravan_type: str = None) -> Caravan:
+        """Create a caravan at (q, r) and add it to the world"""
+        caravan = self._acquire_caravan(q, r, caravan_type)
+        self.add_caravan(caravan)
+        return caravan
+
+    def _unindex_caravan(self, caravan: Caravan, pos: Tuple[int, int]):
+        """Remove a caravan from the hex bucket at pos"""
+        bucket = self.hex_index.get(pos)
+        if bucket and caravan in bucket:
+            bucket.remove(caravan)
+            if not bucket:
+                del self.hex_index[pos]
+
+    def _schedule_move(self, caravan: Caravan):
+        """Queue a caravan's next move by the time it becomes due"""
+        due_time = caravan.last_move_time + caravan.move_interval
+        heapq.heappush(self._move_heap, (due_time, caravan.uid, caravan))
+
+    def update_caravans(self, current_time: float):
+        """Move caravans whose next move is due and keep the hex index in sync"""
+        heap = self._move_heap
+        due = []
+        while heap and heap[0][0] <= current_time:
+            _, uid, caravan = heapq.heappop(heap)
+            # Entries of caravans removed since they were queued are dropped here
+            if self._caravans.get(uid) is caravan:
+                due.append(caravan)
+
+        for caravan in due:
+            old_pos = (caravan.q, caravan.r)
+            caravan.update_movement(current_time)
+            if (caravan.q, caravan.r) != old_pos:
+                self._unindex_caravan(caravan, old_pos)
+                self.hex_index.setdefault((caravan.q, caravan.r), []).append(caravan)
+            self._schedule_move(caravan)
+
+    def caravans_at(self, q: int, r: int) -> List[Caravan]:
+        """Get caravans currently on hex (q, r)"""
+        return list(self.hex_index.get((q, r), ()))
+
+    def caravans_near(self, q: int, r: int, radius: int) -> List[Caravan]:
+        """Get caravans within radius hexes of (q, r)"""
+        # Large radius on a sparse map: one distance test per caravan beats
+        # visiting every hex in the area
+        area = 3 * radius * (radius + 1) + 1
+        if area > len(self._caravans):
+            return [
+                c for c in self._caravans.values()
+                if (abs(c.q - q) + abs(c.r - r) + abs(c.q + c.r - q - r)) // 2 <= radius
+            ]
+
+        found = []
+        for pos in hex_range(q, r, radius):
+            bucket = self.hex_index.get(pos)
+            if bucket:
+                found.extend(bucket)
+        return found
+
+    def features_near(self, q: int, r: int, radius: int) -> List[Tuple[int, int, str]]:
+        """Get (q, r, feature_type) of map features within radius hexes of (q, r)"""
+        features = self.map_features
+        # Same trade-off as caravans_near: scan the features when they are fewer than the hexes
+        area = 3 * radius * (radius + 1) + 1
+        if area > len(features):
+            return [
+                (fq, fr, feature) for (fq, fr), feature in features.items()
+                if (abs(fq - q) + abs(fr - r) + abs(fq + fr - q - r)) // 2 <= radius
+            ]
+
+        found = []
+        for pos in hex_range(q, r, radius):
+            feature = features.get(pos)
+            if feature is not None:
+                found.append((pos[0], pos[1], feature))
+        return found
+
+    def mark_explored(self, q: int, r: int):
+        """Mark hex (q, r) as explored"""
+        key = _pack_hex(q, r)
+        if key not in self.explored_hexes:
+            self.explored_hexes.add(key)
+            self._explored_delta.add(key)
+            self._dirty = True
+
+    def is_explored(self, q: int, r: int) -> bool:
+        """Check if hex (q, r) has been explored"""
+        return _pack_hex(q, r) in self.explored_hexes
+
+    def get_explored_hexes(self) -> List[Tuple[int, int]]:
+        """Get coordinates of all explored hexes"""
+        return [_unpack_hex(key) for key in self.explored_hexes]
 
     def save_game(self):
-        """Save game state to JSON file"""
+        """Save game state to the save file"""
+        size = self.CAMP_SIZE
+        caravans = list(self.visible_caravans)
         save_data = {
+            'save_version': self.SAVE_VERSION,
             'resources': self.resources,
             'resource_rates': self.resource_rates,
             'resource_timers': self.resource_timers,
@@ -538,6 +997,7 @@ class GameData:
             'clan_damage_contributed': self.clan_damage_contributed,
             'daily_event_active': self.daily_event_active,
             'daily_event_end_time': self.daily_event_end_time,
+            'daily_event_type': self.daily_event_type,
             'weekly_event_active': self.weekly_event_active,
             'weekly_event_end_time': self.weekly_event_end_time,
 
@@ -560,11 +1020,8 @@ class GameData:
 
             # Buildings
             'camp_buildings': {
-                f"{x},{y}": {
-                    'type': b.building_type,
-                    'level': b.level
-                }
-                for (x, y), b in self.camp_buildings.items()
+                '%d,%d' % (idx % size, idx // size): [b.building_type, b.level]
+                for idx, b in enumerate(self.camp_buildings) if b is not None
             },
 
             # Tech tree
@@ -572,44 +1029,183 @@ class GameData:
 
             # World state
             'camp_location': {'q': self.camp_q, 'r': self.camp_r},
-            'map_features': {f"{q},{r}": feature for (q, r), feature in self.map_features.items()},
-            'visible_caravans': [
-                {
-                    'q': c.q,
-                    'r': c.r,
-                    'type': c.caravan_type,
-                    'escorts': c.escorts,
-                    'loot_value': c.loot_value,
-                    'movement_path': c.movement_path,
-                    'last_move_time': c.last_move_time
-                }
-                for c in self.visible_caravans
-            ],
-            'explored_hexes': list(self.explored_hexes),
+            'map_features': {
+                'qs': [q for q, _ in self.map_features],
+                'rs': [r for _, r in self.map_features],
+                'features': list(self.map_features.values())
+            },
+            'visible_caravans': {
+                'qs': [c.q for c in caravans],
+                'rs': [c.r for c in caravans],
+                'types': [c.caravan_type for c in caravans],
+                'escorts': [c.escorts for c in caravans],
+                'loot_values': [c.loot_value for c in caravans],
+                'target_qs': [c.target_q for c in caravans],
+                'target_rs': [c.target_r for c in caravans],
+                'last_move_times': [c.last_move_time for c in caravans]
+            },
 
             # Game state
-            'last_water_update': self.last_water_update,
+            'last_water_update': self._tick_time,  # When this save was taken, see load_game
             'last_sandstorm_check': self.last_sandstorm_check,
             'sandstorm_active': self.sandstorm_active,
             'sandstorm_duration': self.sandstorm_duration
         }
 
         try:
-            with open(self.SAVE_FILE, 'w') as f:
-                json.dump(save_data, f, indent=2)
+            if (self._last_saved_snapshot is None
+                    or self._saves_since_base >= self.FULL_SAVE_INTERVAL
+                    or self._existing_save_file() is None):
+                self._write_full_save(save_data)
+            else:
+                self._append_save_delta(save_data)
+            self._dirty = False
+            self._last_save_time = time.time()
             print(f"Game saved to {self.SAVE_FILE}")
         except Exception as e:
             print(f"Failed to save game: {e}")
 
+    def maybe_save(self, min_interval: float = AUTOSAVE_INTERVAL):
+        """Save if anything changed and the last save is at least min_interval seconds old"""
+        if self._dirty and time.time() - self._last_save_time >= min_interval:
+            self.save_game()
+
+    def _existing_save_file(self) -> Optional[str]:
+        """Path of the save to load, falling back to an older JSON save"""
+        for path in (self.SAVE_FILE, self.JSON_SAVE_FILE):
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _write_full_save(self, save_data: Dict[str, Any]):
+        """Write the complete state as a new base and drop the old delta log"""
+        save_data['base_rev'] = self._base_rev + 1
+        snapshot = copy.deepcopy(save_data)  # explored_hexes is tracked by _explored_delta instead
+        save_data['explored_hexes'] = list(self.explored_hexes)  # Packed hex keys
+
+        # Stream into a temp file and swap it in so a crash can't leave a truncated save
+        tmp_path = self.SAVE_FILE + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            _dump(save_data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.SAVE_FILE)
+
+        # The base now lives in the binary file, forget the migrated JSON one
+        if self.SAVE_FILE != self.JSON_SAVE_FILE and os.path.exists(self.JSON_SAVE_FILE):
+            os.remove(self.JSON_SAVE_FILE)
+
+        # Any deltas left behind by a crash here carry the old base_rev and are skipped on load
+        if os.path.exists(self.SAVE_DELTA_FILE):
+            os.remove(self.SAVE_DELTA_FILE)
+
+        self._base_rev = save_data['base_rev']
+        self._saves_since_base = 0
+        self._last_saved_snapshot = snapshot
+        self._explored_delta.clear()
+
+    def _append_save_delta(self, save_data: Dict[str, Any]):
+        """Append only the sections that changed since the last checkpoint"""
+        save_data['base_rev'] = self._base_rev
+        snapshot = self._last_saved_snapshot
+        delta = {}
+        items = {}
+        changed_keys = []
+
+        for key, value in save_data.items():
+            old_value = snapshot.get(key)
+            if old_value == value:
+                continue
+            if key in self._ITEM_DIFF_SECTIONS and isinstance(old_value, dict):
+                items[key] = {
+                    'set': {k: v for k, v in value.items() if old_value.get(k) != v},
+                    'removed': [k for k in old_value if k not in value]
+                }
+            else:
+                delta[key] = value
+            changed_keys.append(key)
+
+        removed_keys = [key for key in snapshot if key not in save_data]
+
+        if (not removed_keys and not self._explored_delta and
+                all(self._is_volatile_change(key, snapshot.get(key), save_data[key])
+                    for key in changed_keys)):
+            return  # Only timestamps moved since the last checkpoint
+
+        record = {
+            'base_rev': self._base_rev,
+            'delta': delta,
+            'removed_keys': removed_keys,
+            'items': items,
+            'explored_added': list(self._explored_delta)
+        }
+        with open(self.SAVE_DELTA_FILE, 'ab') as f:
+            f.write(_dumps(record) + b'\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+        # Only advance the snapshot once the record is on disk
+        for key in changed_keys:
+            snapshot[key] = copy.deepcopy(save_data[key])
+        for key in removed_keys:
+            del snapshot[key]
+        self._explored_delta.clear()
+        self._saves_since_base += 1
+
+    def _is_volatile_change(self, key: str, old_value: Any, new_value: Any) -> bool:
+        """True when old_value and new_value differ only in volatile timestamp fields"""
+        if key not in self._VOLATILE_SAVE_FIELDS:
+            return False
+        fields = self._VOLATILE_SAVE_FIELDS[key]
+        if not fields:
+            return True
+        if not isinstance(old_value, dict) or not isinstance(new_value, dict):
+            return False
+        return ({k: v for k, v in old_value.items() if k not in fields} ==
+                {k: v for k, v in new_value.items() if k not in fields})
+
+    def _replay_save_deltas(self, save_data: Dict[str, Any]) -> int:
+        """Apply logged delta records on top of the base save, returns how many were applied"""
+        if not os.path.exists(self.SAVE_DELTA_FILE):
+            return 0
+
+        applied = 0
+        with open(self.SAVE_DELTA_FILE, 'rb') as f:
+            for line in f:
+                try:
+                    record = _loads(line)
+                except ValueError:
+                    break  # Torn final record from an interrupted write
+                if record.get('base_rev') != save_data.get('base_rev'):
+                    continue  # Belongs to an older base
+
+                save_data.update(record.get('delta', {}))
+                for key in record.get('removed_keys', []):
+                    save_data.pop(key, None)
+                for section, changes in record.get('items', {}).items():
+                    section_data = save_data.setdefault(section, {})
+                    section_data.update(changes['set'])
+                    for key in changes['removed']:
+                        section_data.pop(key, None)
+                save_data.setdefault('explored_hexes', []).extend(record.get('explored_added', []))
+                applied += 1
+        return applied
+
     def load_game(self):
-        """Load game state from JSON file"""
-        if not os.path.exists(self.SAVE_FILE):
+        """Load game state from the save file"""
+        save_path = self._existing_save_file()
+        if save_path is None:
             print("No save file found, starting new game")
             return
 
         try:
-            with open(self.SAVE_FILE, 'r') as f:
-                save_data = json.load(f)
+            with open(save_path, 'rb') as f:
+                save_data = _loads(f.read())
+            deltas_applied = self._replay_save_deltas(save_data)
+
+            save_version = save_data.get('save_version', 1)
+            if save_version > self.SAVE_VERSION:
+                raise ValueError(f"save version {save_version} is newer than supported version {self.SAVE_VERSION}")
 
             # Load basic resources and stats
             self.resources = save_data.get('resources', self.resources)
@@ -630,8 +1226,12 @@ class GameData:
             self.clan_damage_contributed = save_data.get('clan_damage_contributed', 0)
             self.daily_event_active = save_data.get('daily_event_active', False)
             self.daily_event_end_time = save_data.get('daily_event_end_time', 0)
+            self._set_daily_event_type(save_data.get('daily_event_type'))
+            boosted = self.daily_event_active and self.daily_event_type == 'resource_boost'
+            self.resource_rate_multiplier = _RESOURCE_BOOST_MULTIPLIER if boosted else 1.0
             self.weekly_event_active = save_data.get('weekly_event_active', False)
             self.weekly_event_end_time = save_data.get('weekly_event_end_time', 0)
+            self._rebuild_event_heap()
 
             # Monetization
             self.gems = save_data.get('gems', self.gems)
@@ -646,14 +1246,22 @@ class GameData:
                     if i < len(self.heroes):
                         self.heroes[i].level = hero_data.get('level', 1)
                         self.heroes[i].available = hero_data.get('available', True)
+            self._rebuild_hero_bonus_totals()
 
             # Load buildings
-            self.camp_buildings = {}
+            self.camp_buildings = [None] * (self.CAMP_SIZE * self.CAMP_SIZE)
             if 'camp_buildings' in save_data:
+                # [type, level] pairs, saves before version 5 store {'type', 'level'} dicts
                 for pos_str, building_data in save_data['camp_buildings'].items():
-                    x, y = map(int, pos_str.split(','))
-                    building = Building(building_data['type'], building_data['level'])
-                    self.camp_buildings[(x, y)] = building
+                    x, y = pos_str.split(',')
+                    x, y = int(x), int(y)
+                    if isinstance(building_data, dict):
+                        building = Building(building_data['type'], building_data['level'])
+                    else:
+                        building = Building(*building_data)
+                    self.camp_buildings[y * self.CAMP_SIZE + x] = building
+            self.buildings_version += 1
+            self._rebuild_effect_totals()
 
             # Load tech tree
             if 'tech_unlocked' in save_data:
@@ -671,40 +1279,76 @@ class GameData:
             self.camp_q = camp_loc['q']
             self.camp_r = camp_loc['r']
 
-            # Load map features
-            self.map_features = {}
-            if 'map_features' in save_data:
-                for pos_str, feature in save_data['map_features'].items():
-                    q, r = map(int, pos_str.split(','))
-                    self.map_features[(q, r)] = feature
+            # Load map features as parallel qs/rs/features lists. Version 3 saves
+            # store [q, r, feature] triples, older ones key them by "q,r" strings
+            map_features = save_data.get('map_features', [])
+            if 'qs' in map_features:
+                self.map_features = dict(zip(
+                    zip(map_features['qs'], map_features['rs']), map_features['features']
+                ))
+            elif isinstance(map_features, dict):
+                self.map_features = {}
+                for pos_str, feature in map_features.items():
+                    q, r = pos_str.split(',')
+                    self.map_features[(int(q), int(r))] = feature
+            else:
+                self.map_features = {(q, r): feature for q, r, feature in map_features}
 
             # Load visible caravans
-            self.visible_caravans = []
-            for caravan_data in save_data.get('visible_caravans', []):
-                caravan = Caravan(
-                    caravan_data['q'],
-                    caravan_data['r'],
-                    caravan_data['type']
+            self._caravans = {}
+            self.hex_index = {}
+            self._move_heap = []
+            caravans = save_data.get('visible_caravans', [])
+            if isinstance(caravans, dict):
+                rows = zip(
+                    caravans['qs'], caravans['rs'], caravans['types'], caravans['escorts'],
+                    caravans['loot_values'], caravans['target_qs'], caravans['target_rs'],
+                    caravans['last_move_times']
                 )
+            else:
+                rows = [_legacy_caravan_row(caravan_data) for caravan_data in caravans]
+            for q, r, caravan_type, escorts, loot_value, target_q, target_r, last_move_time in rows:
+                caravan = self._acquire_caravan(q, r, caravan_type)
                 # Override generated properties with saved ones
-                caravan.escorts = caravan_data['escorts']
-                caravan.loot_value = caravan_data['loot_value']
-                caravan.movement_path = caravan_data.get('movement_path', [])
-                caravan.last_move_time = caravan_data.get('last_move_time', time.time())
-                self.visible_caravans.append(caravan)
-
-            self.explored_hexes = set(save_data.get('explored_hexes', []))
+                caravan.restore_cargo(escorts, loot_value)
+                if target_q is not None:
+                    caravan.target_q, caravan.target_r = target_q, target_r
+                caravan.last_move_time = last_move_time
+                self.add_caravan(caravan)
+
+            # Older saves store explored hexes as [q, r] pairs
+            self.explored_hexes = {
+                _pack_hex(*key) if isinstance(key, list) else key
+                for key in save_data.get('explored_hexes', [])
+            }
 
             # Load game state
-            self.last_water_update = save_data.get('last_water_update', time.time())
             self.last_sandstorm_check = save_data.get('last_sandstorm_check', time.time())
             self.sandstorm_active = save_data.get('sandstorm_active', False)
             self.sandstorm_duration = save_data.get('sandstorm_duration', 0)
+            # A sandstorm keeps blowing while the game is closed, update() ends it if it ran out
+            saved_at = save_data.get('last_water_update')
+            if self.sandstorm_active and saved_at is not None:
+                self.sandstorm_duration -= max(0.0, time.time() - saved_at)
 
             # Update derived stats
             self.update_derived_stats()
 
-            print(f"Game loaded from {self.SAVE_FILE}")
+            # Later saves diff against what is on disk now
+            self._base_rev = save_data.get('base_rev', 0)
+            self._saves_since_base = deltas_applied
+            if 'base_rev' in save_data:
+                self._last_saved_snapshot = copy.deepcopy(
+                    {key: value for key, value in save_data.items() if key != 'explored_hexes'}
+                )
+            else:
+                # Saves from before delta checkpoints have no base_rev for deltas to match,
+                # so the next save rewrites the full base
+                self._last_saved_snapshot = None
+            self._explored_delta = set()
+            self._dirty = False  # Matches what is on disk
+
+            print(f"Game loaded from {save_path}")
 
         except Exception as e:
             print(f"Failed to load game: {e}")
@@ -712,20 +1356,19 @@ class GameData:
 
     def reset_game(self):
         """Reset game to initial state"""
-        if os.path.exists(self.SAVE_FILE):
-            os.remove(self.SAVE_FILE)
+        for path in (self.SAVE_FILE, self.JSON_SAVE_FILE, self.SAVE_DELTA_FILE):
+            if os.path.exists(path):
+                os.remove(path)
 
-        # Reinitialize
-        self.__init__()
+        self._reset_state()
+        self.initialize_world()
 
     def get_power_level(self) -> int:
         """Calculate player's power level for leaderboards"""
         base_power = self.raiders_available * 10
 
-        # Building power
-        building_power = 0
-        for building in self.camp_buildings.values():
-            building_power += (building.level * 50) * len(self.TYPE_CONFIGS)
+        # Building power, from the running level total kept with the effect totals
+        building_power = self._building_level_total * 50 * len(Building.BUILDING_TYPES)
 
         # Resource wealth
         resource_power = sum(self.resources.values()) // 10
@@ -737,7 +1380,6 @@ class GameData:
 
     def sync_player_profile(self):
         """Sync player profile to Firebase"""
-        from firebase_config import safe_firebase_operation, get_database, DB_PATHS
 
         if not self.player_id:
             return
@@ -751,30 +1393,30 @@ class GameData:
             "last_active": time.time(),
             "raiders": self.raiders_available,
             "resources": sum(self.resources.values()),
-            "buildings": len(self.camp_buildings)
+            "buildings": sum(1 for b in self.camp_buildings if b is not None)
         }
 
-        def update_profile():
-            db = get_database()
-            if db:
-                db.child(DB_PATHS["players"]).child(self.player_id).set(profile_data)
-
-        safe_firebase_operation(update_profile)
+        # One path per field: writing players/<id> whole would wipe its events subtree, and a
+        # batch holding both an ancestor and a descendant path is rejected by Firebase
+        player_path = f"{DB_PATHS['players']}/{self.player_id}"
+        for field, value in profile_data.items():
+            queue_firebase_update(f"{player_path}/{field}", value)
 
     def start_world_boss_event(self):
         """Start the world boss Sandworm event"""
-        from caravan import Caravan
-
         # Create Sandworm at center of map
-        sandworm = Caravan(0, 0, 'sandworm')
+        sandworm = self._acquire_caravan(0, 0, 'sandworm')
         self.world_boss_caravan = sandworm
-        self.visible_caravans.append(sandworm)
+        self.add_caravan(sandworm)
         self.world_boss_active = True
-        self.world_boss_end_time = time.time() + (7 * 24 * 60 * 60)  # 7 days
+        self.world_boss_end_time = time.time() + _WORLD_BOSS_DURATION
+        self._schedule_event_end('world_boss', self.world_boss_end_time)
+        self._mark_event_dirty('world_boss_active', 'world_boss_end_time')
 
         # Reset clan damage tracking
         self.clan_damage_contributed = 0
-        sandworm.clan_damage = {}
+        sandworm.clan_damage = collections.defaultdict(int)
+        self._boss_status_cache = None
 
         print("WORLD BOSS EVENT STARTED: The legendary Sandworm has emerged!")
 
@@ -784,16 +1426,22 @@ class GameData:
             return
 
         self.world_boss_active = False
+        self._mark_event_dirty('world_boss_active')
+        self._boss_status_cache = None
 
         if self.world_boss_caravan:
-            # Remove Sandworm from world
-            if self.world_boss_caravan in self.visible_caravans:
-                self.visible_caravans.remove(self.world_boss_caravan)
+            # Send any damage still buffered before the boss goes away
+            self.flush_boss_damage()
 
             # Calculate rewards based on clan performance
             # This would sync with Firebase to get global rankings
-            total_damage = sum(self.world_boss_caravan.clan_damage.values())
-            player_damage = self.world_boss_caravan.clan_damage.get(self.clan_id or self.player_id, 0)
+            boss = self.world_boss_caravan
+            total_damage = sum(boss.clan_damage.values())
+            player_damage = boss.clan_damage.get(self._contributor_id, 0)
+
+            # Remove Sandworm from world, it goes back to the caravan pool so drop our reference first
+            self.world_boss_caravan = None
+            self.remove_caravan(boss)
 
             if total_damage > 0:
                 damage_percentage = player_damage / total_damage
@@ -810,47 +1458,38 @@ class GameData:
 
     def start_daily_event(self):
         """Start a daily event"""
-        import random
-
-        event_types = ['caravan_alert', 'resource_boost', 'raid_bonus']
-        event_type = random.choice(event_types)
+        event_type = random.choice(_DAILY_EVENT_TYPES)
 
         self.daily_event_active = True
-        self.daily_event_type = event_type
-        self.daily_event_end_time = time.time() + (24 * 60 * 60)  # 24 hours
-
-        if event_type == 'caravan_alert':
-            # Spawn guaranteed high-value caravan
-            from caravan import Caravan
-            caravan = Caravan(random.randint(-10, 10), random.randint(-10, 10), 'gold')
-            self.visible_caravans.append(caravan)
-            print("DAILY EVENT: Caravan Alert! High-value caravan spotted!")
-
-        elif event_type == 'resource_boost':
-            # Double resource generation for 24 hours
-            for resource in self.resource_rates:
-                self.resource_rates[resource] *= 2
-            print("DAILY EVENT: Resource Boost! 2x resource generation!")
+        self._set_daily_event_type(event_type)
+        self.daily_event_end_time = time.time() + _DAILY_EVENT_DURATION
+        self._schedule_event_end('daily', self.daily_event_end_time)
+        self._mark_event_dirty('daily_event_active', 'daily_event_type', 'daily_event_end_time')
 
-        elif event_type == 'raid_bonus':
-            # Bonus raid rewards
-            print("DAILY EVENT: Raid Bonus! All raids give bonus loot!")
+        _DAILY_START_HANDLERS[event_type](self)
 
     def end_daily_event(self):
         """End the daily event"""
-        if self.daily_event_type == 'resource_boost':
-            # Restore normal resource rates
-            for resource in self.resource_rates:
-                self.resource_rates[resource] /= 2
+        end_handler = _DAILY_END_HANDLERS.get(self.daily_event_type)
+        if end_handler is not None:
+            end_handler(self)
 
         self.daily_event_active = False
-        self.daily_event_type = None
+        self._set_daily_event_type(None)
+        self._mark_event_dirty('daily_event_active', 'daily_event_type')
+
+    def _set_daily_event_type(self, event_type: Optional[str]):
+        """Set the daily event type along with its display name"""
+        self.daily_event_type = event_type
+        self.daily_event_display_name = event_type.replace('_', ' ').title() if event_type else None
 
     def start_weekly_event(self):
         """Start the weekly Black Gold Rush event"""
         self.weekly_event_active = True
         self.weekly_event_type = 'black_gold_rush'
-        self.weekly_event_end_time = time.time() + (7 * 24 * 60 * 60)  # 7 days
+        self.weekly_event_end_time = time.time() + _WEEKLY_EVENT_DURATION
+        self._schedule_event_end('weekly', self.weekly_event_end_time)
+        self._mark_event_dirty('weekly_event_active', 'weekly_event_type', 'weekly_event_end_time')
 
         # Double loot from all raids
         print("WEEKLY EVENT: Black Gold Rush! Double loot from all raids!")
@@ -859,37 +1498,77 @@ class GameData:
         """End the weekly event"""
         self.weekly_event_active = False
         self.weekly_event_type = None
+        self._mark_event_dirty('weekly_event_active', 'weekly_event_type')
+
+    def _mark_event_dirty(self, *fields: str):
+        """Record event attributes that changed and need syncing"""
+        self._dirty_event_fields.update(fields)
+        self._dirty = True
+
+    def sync_event_state(self):
+        """Send only the event attributes changed since the last sync to Firebase"""
+        fields = self._dirty_event_fields
+        self._dirty_event_fields = set()
+        if not fields or not self.player_id:
+            return
 
-    def check_event_timers(self):
-        """Check and update event timers"""
-        current_time = time.time()
-
-        # Check daily event
-        if self.daily_event_active and current_time >= self.daily_event_end_time:
-            self.end_daily_event()
-
-        # Check weekly event
-        if self.weekly_event_active and current_time >= self.weekly_event_end_time:
-            self.end_weekly_event()
+        # One path per field, the write queue merges them into one multi-path update
+        events_path = f"{DB_PATHS['players']}/{self.player_id}/events"
+        for field in fields:
+            queue_firebase_update(f"{events_path}/{field}", getattr(self, field))
+
+    def _schedule_event_end(self, kind: str, end_time: float):
+        """Queue the end of a timed event (kind is a key of _TIMED_EVENTS)"""
+        heapq.heappush(self._event_heap, (end_time, kind))
+
+    def check_event_timers(self, current_time: Optional[float] = None):
+        """End every timed event whose end time has passed"""
+        if current_time is None:
+            current_time = self.update_tick_time()
+
+        # Idle ticks cost a single compare against the earliest end time
+        # Send buffered world boss damage in one batch
+        if self._pending_boss_hits and (
+                self._pending_boss_hits >= self.BOSS_DAMAGE_FLUSH_HITS
+                or current_time - self._last_boss_damage_flush >= self.BOSS_DAMAGE_FLUSH_INTERVAL):
+            self.flush_boss_damage(current_time)
+
+        heap = self._event_heap
+        while heap and heap[0][0] <= current_time:
+            end_time, kind = heapq.heappop(heap)
+            active_attr, end_attr, end_method = self._TIMED_EVENTS[kind]
+            # Skip entries left behind by events that already ended or were restarted
+            if getattr(self, active_attr) and getattr(self, end_attr) == end_time:
+                getattr(self, end_method)()
+
+        if self._dirty_event_fields:
+            self.sync_event_state()
+
+    def _rebuild_event_heap(self):
+        """Requeue the end of every active timed event, e.g. after loading"""
+        self._event_heap = []
+        for kind, (active_attr, end_attr, _) in self._TIMED_EVENTS.items():
+            if getattr(self, active_attr):
+                self._schedule_event_end(kind, getattr(self, end_attr))
+
+    def get_active_events(self) -> Sequence[Dict[str, Any]]:
+        """Get currently active events (a shared empty tuple when there are none)"""
+        if not (self.daily_event_active or self.weekly_event_active or self.world_boss_active):
+            return _EMPTY_EVENTS  # Common case, no allocation
 
-        # Check world boss
-        if self.world_boss_active and current_time >= self.world_boss_end_time:
-            self.end_world_boss_event()
-
-    def get_active_events(self) -> List[Dict[str, Any]]:
-        """Get list of currently active events"""
         events = []
+        current_time = self._tick_time
 
         if self.daily_event_active:
-            time_remaining = max(0, self.daily_event_end_time - time.time())
+            time_remaining = max(0, self.daily_event_end_time - current_time)
             events.append({
                 "type": "daily",
-                "name": self.daily_event_type.replace('_', ' ').title(),
+                "name": self.daily_event_display_name or "Daily Event",
                 "time_remaining": time_remaining
             })
 
         if self.weekly_event_active:
-            time_remaining = max(0, self.weekly_event_end_time - time.time())
+            time_remaining = max(0, self.weekly_event_end_time - current_time)
             events.append({
                 "type": "weekly",
                 "name": "Black Gold Rush",
@@ -912,35 +1591,67 @@ class GameData:
         if not self.world_boss_active or not self.world_boss_caravan:
             return
 
-        clan_id = self.clan_id or self.player_id  # Use player ID if no clan
-        self.world_boss_caravan.current_health -= damage
-        self.world_boss_caravan.clan_damage[clan_id] = self.world_boss_caravan.clan_damage.get(clan_id, 0) + damage
+        clan_id = self._contributor_id  # Player ID if no clan
+        boss = self.world_boss_caravan
+        boss.current_health = max(0, boss.current_health - damage)
+        boss.clan_damage[clan_id] += damage  # defaultdict, one lookup
         self.clan_damage_contributed += damage
+        self._boss_status_cache = None
+
+        # Buffered, check_event_timers sends it in batches
+        self._pending_boss_damage[clan_id] += damage
+        self._pending_boss_hits += 1
 
         # Check if boss is defeated
         if self.world_boss_caravan.current_health <= 0:
             self.end_world_boss_event()
 
+    def flush_boss_damage(self, current_time: Optional[float] = None):
+        """Queue this player's world boss damage totals for every clan hit since the last flush"""
+        pending = self._pending_boss_damage
+        self._pending_boss_damage = collections.defaultdict(int)
+        self._pending_boss_hits = 0
+        self._last_boss_damage_flush = current_time if current_time is not None else time.time()
+
+        if not pending or not self.player_id or not self.world_boss_caravan:
+            return
+
+        # Totals rather than increments, so a resent write can't double count;
+        # the write queue merges these into one multi-path update
+        clan_damage = self.world_boss_caravan.clan_damage
+        for clan_id in pending:
+            queue_firebase_update(
+                f"{DB_PATHS['world_boss']}/clan_damage/{clan_id}/{self.player_id}",
+                clan_damage.get(clan_id, 0)
+            )
+
     def get_world_boss_status(self) -> Dict[str, Any]:
-        """Get current world boss status"""
+        """Get current world boss status (shared within a tick, don't mutate)"""
         if not self.world_boss_active or not self.world_boss_caravan:
             return {"active": False}
 
-        time_remaining = max(0, self.world_boss_end_time - time.time())
-        health_percentage = (self.world_boss_caravan.current_health / self.world_boss_caravan.max_health) * 100
+        # HUD, map and popups may all poll in the same tick; damage and boss changes clear the cache
+        if self._boss_status_cache is not None and self._boss_status_time == self._tick_time:
+            return self._boss_status_cache
+
+        time_remaining = max(0, self.world_boss_end_time - self._tick_time)
+        health_percentage = self.world_boss_caravan.current_health * self.world_boss_caravan.health_percent_factor
 
         # Get top 10 clans (would be from Firebase in real implementation)
-        top_clans = sorted(self.world_boss_caravan.clan_damage.items(), key=lambda x: x[1], reverse=True)[:10]
+        # nlargest keeps a 10-entry heap instead of sorting every clan
+        top_clans = heapq.nlargest(10, self.world_boss_caravan.clan_damage.items(), key=operator.itemgetter(1))
 
-        return {
+        self._boss_status_cache = {
             "active": True,
             "time_remaining": time_remaining,
             "health_percentage": health_percentage,
             "current_health": self.world_boss_caravan.current_health,
             "max_health": self.world_boss_caravan.max_health,
             "top_clans": top_clans,
-            "player_damage": self.world_boss_caravan.clan_damage.get(self.clan_id or self.player_id, 0)
+            "player_damage": self.world_boss_caravan.clan_damage.get(self._contributor_id, 0)
         }
+        self._boss_status_time = self._tick_time
+        return self._boss_status_cache
 
     def get_game_stats(self) -> Dict[str, Any]:
         """Get current game statistics"""
@@ -949,7 +1660,7 @@ class GameData:
             'active_caravans': len(self.visible_caravans),
             'explored_area': len(self.explored_hexes),
             'military_strength': self.raiders_available * 3,  # Rough estimate
-            'resource_generation_rate': sum(self.resource_rates.values()),
+            'resource_generation_rate': sum(self.resource_rates.values()) * self.resource_rate_multiplier,
             'power_level': self.get_power_level(),
             'clan_member': self.clan_id is not None
         }
@@ -28,8 +28,9 @@ from screens.tech_screen import TechScreen
 from screens.clan_screen import ClanScreen
 from screens.shop_screen import ShopScreen
 
-# Import Firebase and monetization
-from firebase_config import initialize_firebase
+# Import game state, Firebase and monetization
+from game_data import GameData
+from firebase_config import initialize_firebase_async
 from monetization import monetization_manager
 
 
@@ -41,16 +42,19 @@ class SaharaRaidersApp(App):
         self.title = 'Sahara Raiders'
         self.icon = 'assets/icon.png'  # Will be added later
 
-        # Initialize Firebase
-        initialize_firebase()
+        # Initialize Firebase (in the background, game starts offline)
+        initialize_firebase_async()
 
         # Game state will be managed by GameData class
         self.game_data = None
 
+        # Once a second callbacks, run from the main update loop instead of their own Clock events
+        self._second_tick_callbacks = []
+        self._second_tick_elapsed = 0.0
+
     def build(self):
         """Build the main screen manager with all game screens"""
         # Initialize game data
-        from game_data import GameData
         self.game_data = GameData()
 
         # Create screen manager with fade transitions
@@ -77,6 +81,24 @@ class SaharaRaidersApp(App):
         # Update game data (timers, resources, etc.)
         if self.game_data:
             self.game_data.update(dt)
+            self.game_data.maybe_save()  # Cheap dirty check, only writes after real changes
+
+        self._second_tick_elapsed += dt
+        if self._second_tick_elapsed >= 1.0:
+            elapsed = self._second_tick_elapsed
+            self._second_tick_elapsed = 0.0
+            for callback in tuple(self._second_tick_callbacks):  # Callbacks may unsubscribe
+                callback(elapsed)
+
+    def subscribe_second_tick(self, callback):
+        """Call callback(dt) about once a second from the main update loop"""
+        if callback not in self._second_tick_callbacks:
+            self._second_tick_callbacks.append(callback)
+
+    def unsubscribe_second_tick(self, callback):
+        """Stop calling a callback added with subscribe_second_tick"""
+        if callback in self._second_tick_callbacks:
+            self._second_tick_callbacks.remove(callback)
 
     def on_pause(self):
         """Handle app pause (mobile)"""
@@ -2,10 +2,21 @@
 Monetization module for Sahara Raiders
 Handles rewarded ads, in-app purchases, and premium currency
 """
+import logging
 import time
-from typing import Callable, Optional, Dict, Any
+from types import MappingProxyType
+from typing import Callable, Optional, Any, Mapping
 from kivy.clock import Clock
 
+# Resolved once, None when plyer is missing and ads/purchases are only simulated
+try:
+    from plyer import platform as _PLATFORM
+except ImportError:
+    _PLATFORM = None
+
+# Debug messages are dropped without formatting unless debug logging is enabled
+log = logging.getLogger(__name__)
+
 # Premium currency
 GEMS_CURRENCY = "gems"
 
@@ -21,6 +32,7 @@ IAP_PRODUCTS = {
     "medium_gem_pack": {
         "id": "medium_gem_pack",
         "gems": 3000,
+        "bonus": 1.1,  # +10% gems, see gems_total
         "price_usd": 4.99,
         "name": "Medium Gem Pack",
         "description": "3000 Gems + 10% Bonus"
@@ -33,13 +45,22 @@ IAP_PRODUCTS = {
         "description": "Legendary Skin + 10k Resources"
     }
 }
+# The catalog is fixed at runtime, so hand out read-only views instead of copies.
+# gems_total is the gems actually granted, with the product's bonus applied once here
+IAP_PRODUCTS = {
+    product_id: MappingProxyType({**product, "gems_total": int(product["gems"] * product.get("bonus", 1.0))})
+    for product_id, product in IAP_PRODUCTS.items()
+}
+_IAP_PRODUCTS_VIEW = MappingProxyType(IAP_PRODUCTS)
 
 class MonetizationManager:
     """Manages all monetization features"""
 
+    __slots__ = ('gems', 'last_ad_watch', 'ad_cooldown')
+
     def __init__(self):
         self.gems = 0
-        self.last_ad_watch = 0
+        self.last_ad_watch = float('-inf')  # time.monotonic() of the last completed ad
         self.ad_cooldown = 300  # 5 minutes between ads
 
     def get_gems(self) -> int:
@@ -49,19 +70,19 @@ class MonetizationManager:
     def add_gems(self, amount: int):
         """Add gems to balance"""
         self.gems += amount
-        print(f"Added {amount} gems. Total: {self.gems}")
+        log.debug("Added %d gems. Total: %d", amount, self.gems)
 
     def spend_gems(self, amount: int) -> bool:
         """Spend gems if available"""
         if self.gems >= amount:
             self.gems -= amount
-            print(f"Spent {amount} gems. Remaining: {self.gems}")
+            log.debug("Spent %d gems. Remaining: %d", amount, self.gems)
             return True
         return False
 
     def can_watch_ad(self) -> bool:
         """Check if player can watch a rewarded ad"""
-        return time.time() - self.last_ad_watch >= self.ad_cooldown
+        return time.monotonic() - self.last_ad_watch >= self.ad_cooldown
 
     def show_rewarded_ad(self, reward_type: str, callback: Callable[[bool], None]):
         """
@@ -72,40 +93,35 @@ class MonetizationManager:
             callback: Function called with success status
         """
         if not self.can_watch_ad():
-            print("Ad cooldown active")
+            log.debug("Ad cooldown active")
             callback(False)
             return
 
-        print(f"Showing rewarded ad for: {reward_type}")
+        log.debug("Showing rewarded ad for: %s", reward_type)
 
         # Check platform and show appropriate ad
-        try:
-            from plyer import platform
-            current_platform = platform
-
-            if current_platform == "android":
-                # TODO: Replace with real AdMob integration
-                # from kivy.core.window import Window
-                # # Real AdMob code would go here
-                # admob.show_rewarded_ad(on_rewarded=lambda: callback(True))
-                print("AdMob rewarded ad would show here")
-
-            elif current_platform == "ios":
-                # TODO: Replace with real iOS ad network integration
-                print("iOS rewarded ad would show here")
-
-            else:
-                # Desktop - simulate ad
-                print("Desktop mode: Simulating ad watch...")
-
-        except ImportError:
-            print("Plyer not available - simulating ad")
+        if _PLATFORM is None:
+            log.debug("Plyer not available - simulating ad")
+        elif _PLATFORM == "android":
+            # TODO: Replace with real AdMob integration
+            # from kivy.core.window import Window
+            # # Real AdMob code would go here
+            # admob.show_rewarded_ad(on_rewarded=lambda: callback(True))
+            log.debug("AdMob rewarded ad would show here")
+
+        elif _PLATFORM == "ios":
+            # TODO: Replace with real iOS ad network integration
+            log.debug("iOS rewarded ad would show here")
+
+        else:
+            # Desktop - simulate ad
+            log.debug("Desktop mode: Simulating ad watch...")
 
         # Simulate ad completion after 3 seconds
         def simulate_ad_completion(dt):
-            self.last_ad_watch = time.time()
+            self.last_ad_watch = time.monotonic()
             success = True  # Simulate success
-            print(f"Ad completed with success: {success}")
+            log.debug("Ad completed with success: %s", success)
             callback(success)
 
         Clock.schedule_once(simulate_ad_completion, 3)
@@ -127,41 +143,33 @@ class MonetizationManager:
 
         product = IAP_PRODUCTS[product_id]
 
-        print(f"Initiating purchase: {product['name']} for ${product['price_usd']}")
+        log.debug("Initiating purchase: %s for $%.2f", product["name"], product["price_usd"])
 
-        try:
-            from plyer import platform
-            current_platform = platform
+        if _PLATFORM is None:
+            log.debug("Plyer not available - simulating purchase")
+        elif _PLATFORM == "android":
+            # TODO: Replace with real Google Play Billing
+            # from kivy.core.window import Window
+            # # Real Google Play Billing code would go here
+            # billing.purchase(product_id, lambda success, data: handle_purchase(success, data))
+            log.debug("Google Play Billing purchase would initiate here")
 
-            if current_platform == "android":
-                # TODO: Replace with real Google Play Billing
-                # from kivy.core.window import Window
-                # # Real Google Play Billing code would go here
-                # billing.purchase(product_id, lambda success, data: handle_purchase(success, data))
-                print("Google Play Billing purchase would initiate here")
+        elif _PLATFORM == "ios":
+            # TODO: Replace with real Apple IAP
+            log.debug("Apple IAP purchase would initiate here")
 
-            elif current_platform == "ios":
-                # TODO: Replace with real Apple IAP
-                print("Apple IAP purchase would initiate here")
-
-            else:
-                # Desktop - simulate purchase
-                print("Desktop mode: Simulating purchase...")
-
-        except ImportError:
-            print("Plyer not available - simulating purchase")
+        else:
+            # Desktop - simulate purchase
+            log.debug("Desktop mode: Simulating purchase...")
 
         # Simulate purchase completion after 2 seconds
         def simulate_purchase(dt):
             success = True  # Simulate success
             if success:
-                gems_received = product["gems"]
-                if product_id == "medium_gem_pack":
-                    gems_received = int(gems_received * 1.1)  # 10% bonus
-
+                gems_received = product["gems_total"]
                 self.add_gems(gems_received)
                 on_success(gems_received)
-                print(f"Purchase completed: {gems_received} gems")
+                log.info("Purchase completed: %d gems", gems_received)
             else:
                 error_msg = "Purchase failed"
                 if on_failure:
@@ -169,13 +177,13 @@ class MonetizationManager:
 
         Clock.schedule_once(simulate_purchase, 2)
 
-    def get_product_info(self, product_id: str) -> Optional[Dict[str, Any]]:
-        """Get information about a product"""
+    def get_product_info(self, product_id: str) -> Optional[Mapping[str, Any]]:
+        """Get information about a product (read-only)"""
         return IAP_PRODUCTS.get(product_id)
 
-    def get_all_products(self) -> Dict[str, Dict[str, Any]]:
-        """Get all available products"""
-        return IAP_PRODUCTS.copy()
+    def get_all_products(self) -> Mapping[str, Mapping[str, Any]]:
+        """Get all available products (read-only view)"""
+        return _IAP_PRODUCTS_VIEW
 
 # Global monetization manager instance
 monetization_manager = MonetizationManager()
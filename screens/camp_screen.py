@@ -1,50 +1,108 @@
 """
 Camp Screen - Building placement and camp management
 """
+import logging
 from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.button import Button
 from kivy.uix.gridlayout import GridLayout
+from kivy.uix.widget import Widget
+from kivy.core.text import Label as CoreLabel
 from kivy.graphics import Color, Rectangle, Ellipse
 from kivy.metrics import dp
 from kivy.app import App
 
+log = logging.getLogger(__name__)
 
-class CampGridWidget(BoxLayout):
-    """8x8 grid for building placement"""
+# Building type -> (grid label prefix, background color)
+BUILDING_STYLES = {
+    'tent': ('T', (0.6, 0.4, 0.2, 1)),  # Brown
+    'well': ('W', (0.3, 0.6, 0.9, 1)),  # Blue
+    'stable': ('S', (0.8, 0.6, 0.4, 1)),  # Tan
+    'watchtower': ('Tw', (0.7, 0.7, 0.7, 1)),  # Gray
+    'slave_pen': ('Sp', (0.5, 0.3, 0.1, 1))  # Dark brown
+}
+EMPTY_CELL_COLOR = (0.8, 0.7, 0.6, 1)  # Desert sand color
+
+# (building type, level) -> rendered cell label texture, shared by every cell showing it
+_LABEL_TEXTURES = {}
+
+
+def _label_texture(building_type: str, level: int):
+    """Texture for a grid cell label such as 'T2', rendered once per type and level"""
+    key = (building_type, level)
+    texture = _LABEL_TEXTURES.get(key)
+    if texture is None:
+        core_label = CoreLabel(text=f'{BUILDING_STYLES[building_type][0]}{level}', font_size=dp(14))
+        core_label.refresh()
+        texture = _LABEL_TEXTURES[key] = core_label.texture
+    return texture
+
+
+class CampGridWidget(Widget):
+    """8x8 grid for building placement, drawn as one batch of canvas rectangles"""
 
     def __init__(self, camp_screen, **kwargs):
         super().__init__(**kwargs)
         self.camp_screen = camp_screen
         self.cols = 8
         self.spacing = dp(2)
-        self.building_buttons = {}
-
-        # Create 8x8 grid of buttons
-        for y in range(8):
-            for x in range(8):
-                button = Button(
-                    text='',
-                    background_color=(0.8, 0.7, 0.6, 1),  # Desert sand color
-                    size_hint=(None, None),
-                    size=(dp(40), dp(40))
-                )
-                button.bind(on_press=lambda btn, x=x, y=y: self.on_grid_click(x, y))
-                self.building_buttons[(x, y)] = button
-                self.add_widget(button)
-
+        self.cell_size = dp(40)
+        self._last_buildings_version = None  # game_data.buildings_version last drawn
+
+        # Per cell background color, background and label rectangles, indexed by y * cols + x
+        self._cell_colors = []
+        self._cell_rects = []
+        self._label_rects = []
+        with self.canvas:
+            for _ in range(self.cols * self.cols):
+                self._cell_colors.append(Color(*EMPTY_CELL_COLOR))
+                self._cell_rects.append(Rectangle(size=(self.cell_size, self.cell_size)))
+                Color(1, 1, 1, 1)
+                self._label_rects.append(Rectangle(size=(0, 0)))
+
+        self.bind(pos=self._layout_cells, size=self._layout_cells)
+        self._layout_cells()
         self.update_grid_display()
 
+    def _layout_cells(self, *args):
+        """Position the cell rectangles, row 0 at the top of the widget"""
+        step = self.cell_size + self.spacing
+        for idx, rect in enumerate(self._cell_rects):
+            y, x = divmod(idx, self.cols)
+            rect.pos = (self.x + x * step, self.top - y * step - self.cell_size)
+            self._center_label(idx)
+
+    def _center_label(self, idx: int):
+        """Center a cell's label rectangle on its cell"""
+        cell_x, cell_y = self._cell_rects[idx].pos
+        label = self._label_rects[idx]
+        width, height = label.size
+        label.pos = (cell_x + (self.cell_size - width) / 2, cell_y + (self.cell_size - height) / 2)
+
+    def on_touch_down(self, touch):
+        """Resolve a touch to its grid cell, one handler for the whole grid"""
+        if not self.collide_point(*touch.pos):
+            return super().on_touch_down(touch)
+
+        step = self.cell_size + self.spacing
+        x = int((touch.x - self.x) // step)
+        y = int((self.top - touch.y) // step)
+        if 0 <= x < self.cols and 0 <= y < self.cols:
+            self.on_grid_click(x, y)
+            return True
+        return super().on_touch_down(touch)
+
     def on_grid_click(self, x, y):
         """Handle clicking on a grid cell"""
         game_data = self.camp_screen.game_data
 
         # Check if there's already a building here
-        if (x, y) in game_data.camp_buildings:
+        if game_data.get_building(x, y) is not None:
             # Try to upgrade existing building
             if game_data.upgrade_building(x, y):
-                print(f"Upgraded building at ({x}, {y})")
+                log.debug("Upgraded building at (%d, %d)", x, y)
         else:
             # Show building selection menu
             self.show_building_menu(x, y)
@@ -62,39 +120,28 @@ class CampGridWidget(BoxLayout):
         if game_data.can_afford(tent_cost):
             if game_data.place_building(x, y, 'tent'):
                 game_data.spend_resources(tent_cost)
-                print(f"Placed tent at ({x}, {y})")
-
-        self.update_grid_display()
+                log.debug("Placed tent at (%d, %d)", x, y)
 
     def update_grid_display(self):
         """Update the visual display of buildings on the grid"""
         game_data = self.camp_screen.game_data
+        if game_data.buildings_version == self._last_buildings_version:
+            return  # Nothing placed or changed level since the last draw
+        self._last_buildings_version = game_data.buildings_version
 
-        for (x, y), button in self.building_buttons.items():
-            if (x, y) in game_data.camp_buildings:
-                building = game_data.camp_buildings[(x, y)]
+        for idx, building in enumerate(game_data.camp_buildings):
+            if building is not None:
                 building_type = building.building_type
-                level = building.level
-
-                # Set button text and color based on building type
-                if building_type == 'tent':
-                    button.text = f'T{level}'
-                    button.background_color = (0.6, 0.4, 0.2, 1)  # Brown
-                elif building_type == 'well':
-                    button.text = f'W{level}'
-                    button.background_color = (0.3, 0.6, 0.9, 1)  # Blue
-                elif building_type == 'stable':
-                    button.text = f'S{level}'
-                    button.background_color = (0.8, 0.6, 0.4, 1)  # Tan
-                elif building_type == 'watchtower':
-                    button.text = f'Tw{level}'
-                    button.background_color = (0.7, 0.7, 0.7, 1)  # Gray
-                elif building_type == 'slave_pen':
-                    button.text = f'Sp{level}'
-                    button.background_color = (0.5, 0.3, 0.1, 1)  # Dark brown
+                color = BUILDING_STYLES[building_type][1]
+                texture = _label_texture(building_type, building.level)
             else:
-                button.text = ''
-                button.background_color = (0.8, 0.7, 0.6, 1)  # Empty sand color
+                color, texture = EMPTY_CELL_COLOR, None
+
+            self._cell_colors[idx].rgba = color
+            label = self._label_rects[idx]
+            label.texture = texture
+            label.size = texture.size if texture is not None else (0, 0)
+            self._center_label(idx)
 
 
 class CampScreen(Screen):
@@ -104,6 +151,7 @@ class CampScreen(Screen):
         super().__init__(**kwargs)
         self.game_data = None
         self.camp_grid = None
+        self._resource_labels = {}  # resource key -> value Label, filled by create_resource_bar
 
     def on_enter(self):
         """Called when entering camp screen"""
@@ -176,11 +224,13 @@ class CampScreen(Screen):
             ('gems', 'Gems')
         ]
 
+        self._resource_labels = {}
+
         for resource_key, display_name in resources:
             resource_box = BoxLayout(orientation='vertical', size_hint_x=0.2)
             title = Label(text=display_name, font_size=dp(12), bold=True)
             value = Label(text=str(int(self.game_data.resources.get(resource_key, 0))), font_size=dp(14))
-            value.id = f'{resource_key}_display'
+            self._resource_labels[resource_key] = value
             resource_box.add_widget(title)
             resource_box.add_widget(value)
             resource_layout.add_widget(resource_box)
@@ -215,11 +265,10 @@ class CampScreen(Screen):
 
     def update_resource_display(self):
         """Update resource display values"""
-        for child in self.walk():
-            if hasattr(child, 'id'):
-                resource_key = child.id.replace('_display', '')
-                if resource_key in self.game_data.resources:
-                    child.text = str(int(self.game_data.resources[resource_key]))
+        resources = self.game_data.resources
+        for resource_key, label in self._resource_labels.items():
+            if resource_key in resources:
+                label.text = str(int(resources[resource_key]))
 
     def recruit_from_slaves(self, instance):
         """Convert slaves to raiders"""
@@ -228,7 +277,7 @@ class CampScreen(Screen):
 
         if slaves_to_convert > 0:
             raiders_gained = self.game_data.recruit_from_slaves(slaves_to_convert)
-            print(f"Converted {slaves_to_convert} slaves to {raiders_gained} raiders")
+            log.debug("Converted %d slaves to %d raiders", slaves_to_convert, raiders_gained)
 
         self.update_resource_display()
 
@@ -53,7 +53,6 @@ class HexMapWidget(FloatLayout):
         self.game_data = game_data
         self.hex_grid = HexGrid(radius=dp(20))  # Smaller hexes for 20x20 grid
         self.map_icons = {}  # Store references to map icons
-        self.caravan_update_event = None
 
         # Add background
         self._add_background()
@@ -80,16 +79,16 @@ class HexMapWidget(FloatLayout):
         self.add_widget(bg)
 
     def _start_caravan_updates(self):
-        """Start periodic caravan movement updates"""
-        if self.caravan_update_event:
-            self.caravan_update_event.cancel()
-        self.caravan_update_event = Clock.schedule_interval(self._update_caravans, 1.0)
+        """Start periodic caravan movement updates, driven by the app's once a second tick"""
+        App.get_running_app().subscribe_second_tick(self._update_caravans)
+
+    def stop_caravan_updates(self):
+        """Stop the periodic caravan updates, before this widget is discarded"""
+        App.get_running_app().unsubscribe_second_tick(self._update_caravans)
 
     def _update_caravans(self, dt):
         """Update caravan positions"""
-        current_time = time.time()
-        for caravan in self.game_data.visible_caravans:
-            caravan.update_movement(current_time)
+        self.game_data.update_caravans(time.time())
         self.update_map_display()
 
     def update_map_display(self):
@@ -120,23 +119,6 @@ class HexMapWidget(FloatLayout):
         # Add scouting spies
         self._add_scouting_spies()
 
-    def _draw_hex_grid(self):
-        """Draw the hexagonal grid on canvas"""
-        with self.canvas.after:
-            self.canvas.after.clear()
-            Color(0.8, 0.7, 0.5, 0.3)  # Light desert grid lines
-
-            center_x, center_y = self.center_x, self.center_y
-            grid_radius = 15  # 31x31 hex grid for 20x20 playable area
-
-            for q in range(-grid_radius, grid_radius + 1):
-                r1 = max(-grid_radius, -q - grid_radius)
-                r2 = min(grid_radius, -q + grid_radius)
-                for r in range(r1, r2 + 1):
-                    hex_center = hex_to_pixel(q, r, self.hex_grid.radius)
-                    hex_center = (center_x + hex_center[0], center_y + hex_center[1])
-                    self._draw_hex_outline(hex_center)
-
     def _draw_hex_outline(self, center):
         """Draw a single hex outline"""
         x, y = center
@@ -399,11 +381,8 @@ class HexMapWidget(FloatLayout):
             self.scouting_spies.remove(spy)
 
         # Check if there's already a caravan at this location
-        existing_caravan = None
-        for caravan in self.game_data.visible_caravans:
-            if caravan.q == spy['q'] and caravan.r == spy['r']:
-                existing_caravan = caravan
-                break
+        caravans_here = self.game_data.caravans_at(spy['q'], spy['r'])
+        existing_caravan = caravans_here[0] if caravans_here else None
 
         if existing_caravan:
             # Scout existing caravan
@@ -412,12 +391,11 @@ class HexMapWidget(FloatLayout):
         else:
             # Chance to find a new caravan
             if random.random() < 0.4:  # 40% chance to find new caravan
-                caravan = Caravan(spy['q'], spy['r'])
-                self.game_data.visible_caravans.append(caravan)
+                caravan = self.game_data.spawn_caravan(spy['q'], spy['r'])
                 print(f"Found new caravan: {caravan.get_description()}")
 
         # Mark hex as explored
-        self.game_data.explored_hexes.add((spy['q'], spy['r']))
+        self.game_data.mark_explored(spy['q'], spy['r'])
 
         self._update_canvas()
 
@@ -464,6 +442,8 @@ class MapScreen(Screen):
         main_layout.add_widget(resource_bar)
 
         # Map area (takes most of the space)
+        if self.hex_map:
+            self.hex_map.stop_caravan_updates()  # Replaced below, don't keep ticking the old map
         self.hex_map = HexMapWidget(self.game_data, size_hint_y=0.8)
         main_layout.add_widget(self.hex_map)
 
@@ -559,11 +539,8 @@ class MapScreen(Screen):
             self.scouting_spies.remove(spy)
 
         # Check if there's already a caravan at this location
-        existing_caravan = None
-        for caravan in self.game_data.visible_caravans:
-            if caravan.q == spy['q'] and caravan.r == spy['r']:
-                existing_caravan = caravan
-                break
+        caravans_here = self.game_data.caravans_at(spy['q'], spy['r'])
+        existing_caravan = caravans_here[0] if caravans_here else None
 
         if existing_caravan:
             # Scout existing caravan
@@ -572,12 +549,11 @@ class MapScreen(Screen):
         else:
             # Chance to find a new caravan
             if random.random() < 0.4:  # 40% chance to find new caravan
-                caravan = Caravan(spy['q'], spy['r'])
-                self.game_data.visible_caravans.append(caravan)
+                caravan = self.game_data.spawn_caravan(spy['q'], spy['r'])
                 print(f"Found new caravan: {caravan.get_description()}")
 
         # Mark hex as explored
-        self.game_data.explored_hexes.add((spy['q'], spy['r']))
+        self.game_data.mark_explored(spy['q'], spy['r'])
 
         # Update map display
         if self.hex_map:
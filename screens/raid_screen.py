@@ -145,9 +145,9 @@ class RaidScreen(Screen):
         # Return heroes from raid
         game_data.return_heroes_from_raid(assigned_heroes)
 
-        # Remove caravan from world
-        if self.target_caravan in game_data.visible_caravans:
-            game_data.visible_caravans.remove(self.target_caravan)
+        # Remove caravan from world, it can be reused for the next spawn so let go of it
+        game_data.remove_caravan(self.target_caravan)
+        self.target_caravan = None
 
         # Show results screen
         self.show_raid_results(success, loot_gained, raiders_lost)
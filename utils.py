@@ -99,8 +99,17 @@ def pixel_to_hex(x: float, y: float, radius: float = 30.0) -> Tuple[int, int]:
 
 def hex_distance(q1: int, r1: int, q2: int, r2: int) -> int:
     """Get distance between two hexes (convenience function)"""
-    grid = HexGrid()
-    return grid.get_hex_distance(q1, r1, q2, r2)
+    # Doesn't depend on the hex size, so skip building a HexGrid
+    return (abs(q1 - q2) + abs(r1 - r2) + abs(q1 + r1 - q2 - r2)) // 2
+
+
+def hex_range(q: int, r: int, radius: int) -> List[Tuple[int, int]]:
+    """Get all hexes within radius of (q, r), including (q, r) itself"""
+    hexes = []
+    for dq in range(-radius, radius + 1):
+        for dr in range(max(-radius, -dq - radius), min(radius, -dq + radius) + 1):
+            hexes.append((q + dq, r + dr))
+    return hexes
 
 
 class ProceduralGenerator:
@@ -157,6 +166,7 @@ class ProceduralGenerator:
             List of (q, r, caravan_type) tuples
         """
         caravans = []
+        occupied = set()
 
         # Generate 4-6 caravans
         num_caravans = random.randint(4, 6)
@@ -169,8 +179,8 @@ class ProceduralGenerator:
                 distance_from_camp = hex_distance(q, r, 0, 0)
                 if distance_from_camp >= 3:  # At least 3 hexes from camp
                     # Check if position is already taken
-                    position_taken = any(c.q == q and c.r == r for c in caravans)
-                    if not position_taken:
+                    if (q, r) not in occupied:
+                        occupied.add((q, r))
                         caravans.append((q, r, None))  # None = random type
                         break
 